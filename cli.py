@@ -23,9 +23,8 @@ def main() -> None:
     crypto_console = CryptoConsole()
     
     try:
-        # Display banner ONCE at startup
-        crypto_console.clear_screen()
-        crypto_console.display_banner()
+        # Display banner ONCE at startup (clear + banner in one write)
+        crypto_console.display_welcome()
         
         # Main loop
         while True:
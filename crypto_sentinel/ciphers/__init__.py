@@ -3,14 +3,30 @@ Classical encryption ciphers module.
 
 Includes implementations for Caesar, Vigenère, XOR, Substitution, and Morse ciphers.
 
+Cipher classes are imported lazily (PEP 562) so that using one cipher does
+not pay the import cost of the others.
+
 Developer: saisrujanmurthy@gmail.com
 """
 
-from .caesar import CaesarCipher
-from .vigenere import VigenereCipher
-from .xor import XORCipher
-from .substitution import SubstitutionCipher
-from .morse import MorseHandler
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .caesar import CaesarCipher
+    from .vigenere import VigenereCipher
+    from .xor import XORCipher
+    from .substitution import SubstitutionCipher
+    from .morse import MorseHandler
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "CaesarCipher": "caesar",
+    "VigenereCipher": "vigenere",
+    "XORCipher": "xor",
+    "SubstitutionCipher": "substitution",
+    "MorseHandler": "morse",
+}
 
 __all__ = [
     "CaesarCipher",
@@ -19,3 +35,21 @@ __all__ = [
     "SubstitutionCipher",
     "MorseHandler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a cipher class on first access and cache it in the module."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = importlib.import_module(f".{module_name}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
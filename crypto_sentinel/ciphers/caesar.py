@@ -7,15 +7,76 @@ a fixed number of positions in the alphabet. Named after Julius Caesar.
 Developer: saisrujanmurthy@gmail.com
 """
 
+import copy
+import re
+import string
+import threading
+from collections import Counter, OrderedDict
 from typing import Any, Union
 from crypto_sentinel.core.base_cipher import CipherInterface
 from crypto_sentinel.core.exceptions import (
-    EncryptionError,
     DecryptionError,
     InvalidKeyError,
     ValidationError,
 )
-from crypto_sentinel.utils.math_helpers import chi_squared
+
+
+# English letter frequency (percentage, A-Z)
+_ENGLISH_FREQ = (
+    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966,
+    0.153, 0.772, 4.025, 2.406, 6.749, 7.507, 1.929, 0.095, 5.987,
+    6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074
+)
+
+# Expected share of each letter; scoring scales these by the letter total
+# instead of rebuilding percentages on every call
+_EXPECTED_PROPORTIONS = tuple(freq / 100.0 for freq in _ENGLISH_FREQ)
+
+# ASCII letter probe for the crack guard (regex scan stops at first match in C)
+_ALPHA_RE = re.compile(r'[A-Za-z]')
+
+# Memoized crack results, keyed by (cipher class, ciphertext). Only short
+# ciphertexts are cached so the cache never pins large strings in memory.
+_CRACK_CACHE_SIZE = 64
+_CRACK_CACHE_MAX_LENGTH = 4096
+_crack_cache: OrderedDict[tuple[type, str], dict[str, Any]] = OrderedDict()
+_crack_cache_lock = threading.Lock()
+
+
+def _build_shift_table(shift: int) -> dict[int, int]:
+    """
+    Build a str.translate table that shifts ASCII letters by a fixed amount.
+    
+    Args:
+        shift: Number of positions to shift (0-25)
+    
+    Returns:
+        Translation table mapping each letter ordinal to its shifted ordinal
+    """
+    upper = string.ascii_uppercase
+    lower = string.ascii_lowercase
+    return str.maketrans(
+        upper + lower,
+        upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift]
+    )
+
+
+def _build_shift_btable(shift: int) -> bytes:
+    """
+    Build a 256-byte bytes.translate table that shifts ASCII letters.
+    
+    Args:
+        shift: Number of positions to shift (0-25)
+    
+    Returns:
+        Translation table usable with bytes.translate
+    """
+    upper = string.ascii_uppercase.encode('ascii')
+    lower = string.ascii_lowercase.encode('ascii')
+    return bytes.maketrans(
+        upper + lower,
+        upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift]
+    )
 
 
 class CaesarCipher(CipherInterface):
@@ -32,7 +93,7 @@ class CaesarCipher(CipherInterface):
     
     Time Complexity:
         - Encrypt/Decrypt: O(n) where n is text length
-        - Crack: O(26n) for trying all possible shifts
+        - Crack: O(n) - one counting pass plus 26 histogram rotations
     
     Space Complexity: O(n) for output string
     
@@ -49,11 +110,15 @@ class CaesarCipher(CipherInterface):
     ALPHABET_SIZE = 26
     
     # English letter frequency (percentage, A-Z)
-    ENGLISH_FREQ = [
-        8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966,
-        0.153, 0.772, 4.025, 2.406, 6.749, 7.507, 1.929, 0.095, 5.987,
-        6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074
-    ]
+    ENGLISH_FREQ = list(_ENGLISH_FREQ)
+    
+    # Precomputed translation tables, one per shift (built once at class load)
+    _TRANS_TABLES = [_build_shift_table(shift) for shift in range(ALPHABET_SIZE)]
+    
+    # Byte-level equivalents for short ASCII input; bytes.translate has less
+    # per-call overhead, while str.translate wins on long inputs
+    _BTRANS = [_build_shift_btable(shift) for shift in range(ALPHABET_SIZE)]
+    _BYTES_PATH_MAX = 4096
     
     def encrypt(self, data: Union[str, bytes], key: Any) -> Union[str, bytes]:
         """
@@ -71,7 +136,6 @@ class CaesarCipher(CipherInterface):
         
         Raises:
             InvalidKeyError: If key is not an integer or out of range
-            EncryptionError: If encryption fails
             ValidationError: If data is not a string
         
         Time Complexity: O(n) where n is length of data
@@ -110,26 +174,8 @@ class CaesarCipher(CipherInterface):
                 details={"key": key, "valid_range": f"0-{self.ALPHABET_SIZE-1}"}
             )
         
-        try:
-            result = []
-            for char in data:
-                if char.isalpha():
-                    # Determine if uppercase or lowercase
-                    base = ord('A') if char.isupper() else ord('a')
-                    # Shift character
-                    shifted = (ord(char) - base + key) % self.ALPHABET_SIZE
-                    result.append(chr(base + shifted))
-                else:
-                    # Preserve non-alphabetic characters
-                    result.append(char)
-            
-            return ''.join(result)
-        
-        except Exception as e:
-            raise EncryptionError(
-                f"Failed to encrypt data: {e}",
-                details={"error": str(e), "key": key}
-            )
+        # Inputs are fully validated above; the translate pass cannot fail
+        return self._encrypt_fast(data, key)
     
     def decrypt(self, data: Union[str, bytes], key: Any) -> Union[str, bytes]:
         """
@@ -163,10 +209,24 @@ class CaesarCipher(CipherInterface):
                 details={"provided_type": type(key).__name__}
             )
         
+        if isinstance(data, bytes):
+            raise ValidationError(
+                "Caesar cipher requires string input, not bytes",
+                details={"provided_type": "bytes"}
+            )
+        
+        if not isinstance(data, str):
+            raise ValidationError(
+                f"Data must be a string, got {type(data).__name__}",
+                details={"provided_type": type(data).__name__}
+            )
+        
         try:
             # Decryption is encryption with negative key
-            return self.encrypt(data, (self.ALPHABET_SIZE - key) % self.ALPHABET_SIZE)
-        except EncryptionError as e:
+            return self._encrypt_fast(
+                data, (self.ALPHABET_SIZE - key) % self.ALPHABET_SIZE
+            )
+        except Exception as e:
             raise DecryptionError(
                 f"Failed to decrypt data: {e}",
                 details={"error": str(e), "key": key}
@@ -197,7 +257,7 @@ class CaesarCipher(CipherInterface):
         Raises:
             ValidationError: If input data is invalid
         
-        Time Complexity: O(26n) = O(n) where n is length of ciphertext
+        Time Complexity: O(n + 26²) where n is length of ciphertext
         Space Complexity: O(n) for storing best plaintext
         
         Examples:
@@ -220,7 +280,44 @@ class CaesarCipher(CipherInterface):
                 details={"provided_type": type(data).__name__}
             )
         
-        if not data or not any(c.isalpha() for c in data):
+        if len(data) > _CRACK_CACHE_MAX_LENGTH:
+            return self._crack_text(data)
+        
+        # Interactive users often retry the same ciphertext; results are
+        # memoized per class and copied so callers cannot mutate the cache
+        cache_key = (type(self), data)
+        with _crack_cache_lock:
+            result = _crack_cache.get(cache_key)
+            if result is not None:
+                _crack_cache.move_to_end(cache_key)
+        
+        if result is None:
+            result = self._crack_text(data)
+            with _crack_cache_lock:
+                _crack_cache[cache_key] = result
+                if len(_crack_cache) > _CRACK_CACHE_SIZE:
+                    _crack_cache.popitem(last=False)
+        
+        return copy.deepcopy(result)
+    
+    def _crack_text(self, data: str) -> dict[str, Any]:
+        """
+        Run frequency analysis on already-validated ciphertext.
+        
+        Args:
+            data: Ciphertext string to crack
+        
+        Returns:
+            Crack result dictionary (see crack)
+        
+        Time Complexity: O(n + 26²) where n is length of ciphertext
+        """
+        # The regex settles the common case; only non-ASCII text without an
+        # ASCII letter needs the full Unicode isalpha() scan
+        if not data or (
+            _ALPHA_RE.search(data) is None
+            and (data.isascii() or not any(c.isalpha() for c in data))
+        ):
             return {
                 'success': False,
                 'key': None,
@@ -233,24 +330,26 @@ class CaesarCipher(CipherInterface):
             }
         
         best_key = 0
-        best_plaintext = ""
         best_score = float('inf')
         scores = {}
         
+        # Shifting permutes the letter histogram cyclically, so count the
+        # ciphertext once and rotate the histogram for each candidate key
+        letter_counts = self._count_letters(data)
+        shift_scores = self._shift_scores(letter_counts)
+        
         for key in range(self.ALPHABET_SIZE):
-            # Try decrypting with this key
-            try:
-                plaintext = self.decrypt(data, key)
-                score = self._score_text(plaintext)
-                scores[key] = score
-                
-                if score < best_score:
-                    best_score = score
-                    best_key = key
-                    best_plaintext = plaintext
+            score = shift_scores[key]
+            scores[key] = score
             
-            except Exception:
-                continue
+            if score < best_score:
+                best_score = score
+                best_key = key
+        
+        # Materialize only the winning plaintext
+        best_plaintext = self._encrypt_fast(
+            data, (self.ALPHABET_SIZE - best_key) % self.ALPHABET_SIZE
+        )
         
         # Calculate confidence (lower chi-squared = higher confidence)
         # Normalize to 0-1 range (chi-squared typically 0-500 for bad matches)
@@ -267,6 +366,26 @@ class CaesarCipher(CipherInterface):
             'best_chi_squared': round(best_score, 4)
         }
     
+    def _encrypt_fast(self, data: str, key: int) -> str:
+        """
+        Shift already-validated text without any input checks.
+        
+        Args:
+            data: Plaintext string
+            key: Integer shift value in range 0-25
+        
+        Returns:
+            Shifted string
+        
+        Time Complexity: O(n) where n is length of data
+        """
+        # Short ASCII input: translate the raw byte buffer instead
+        if len(data) <= self._BYTES_PATH_MAX and data.isascii():
+            return data.encode('ascii').translate(self._BTRANS[key]).decode('ascii')
+        
+        # Single C-level pass; non-alphabetic characters pass through
+        return data.translate(self._TRANS_TABLES[key])
+    
     def _score_text(self, text: str) -> float:
         """
         Score text using chi-squared test against English letter frequencies.
@@ -281,29 +400,88 @@ class CaesarCipher(CipherInterface):
         
         Time Complexity: O(n) where n is text length
         """
-        # Count letter frequencies
-        letter_counts = [0] * self.ALPHABET_SIZE
-        total_letters = 0
+        return self._chi_squared_counts(self._count_letters(text))
+    
+    def _count_letters(self, text: str) -> list[int]:
+        """
+        Count occurrences of each letter A-Z (case-insensitive).
+        
+        Args:
+            text: Text to count
         
-        for char in text.upper():
-            if char.isalpha():
-                letter_counts[ord(char) - ord('A')] += 1
-                total_letters += 1
+        Returns:
+            List of 26 letter counts, indexed A=0 through Z=25
+        
+        Time Complexity: O(n) where n is text length
+        """
+        # ASCII text is counted as-is and both cases are summed, which avoids
+        # allocating an uppercased copy; only non-ASCII text needs upper()
+        # for its case mappings (e.g. 'ß' -> 'SS')
+        if not text.isascii():
+            text = text.upper()
+        
+        counts = Counter(text)
+        return [
+            counts[upper] + counts[lower]
+            for upper, lower in zip(string.ascii_uppercase, string.ascii_lowercase)
+        ]
+    
+    def _shift_scores(self, letter_counts: list[int]) -> list[float]:
+        """
+        Chi-squared score of every candidate shift from one ciphertext histogram.
+        
+        Decrypting with shift k turns ciphertext letter (i + k) into plaintext
+        letter i, so the plaintext histogram is the ciphertext histogram
+        rotated by k. The letter total is shift-invariant, so the expected
+        counts are computed once and shared by all 26 rotations.
+        
+        Args:
+            letter_counts: Ciphertext letter counts, indexed A=0 through Z=25
+        
+        Returns:
+            List of 26 chi-squared scores indexed by shift (inf if no letters)
+        
+        Time Complexity: O(26²) - independent of text length
+        """
+        size = self.ALPHABET_SIZE
+        total_letters = sum(letter_counts)
         
         if total_letters == 0:
-            return float('inf')
+            return [float('inf')] * size
         
-        # Calculate expected frequencies
-        expected = [
-            (freq / 100.0) * total_letters 
-            for freq in self.ENGLISH_FREQ
+        expected = [share * total_letters for share in _EXPECTED_PROPORTIONS]
+        
+        return [
+            sum(
+                (letter_counts[(i + shift) % size] - expected[i]) ** 2 / expected[i]
+                for i in range(size)
+            )
+            for shift in range(size)
         ]
+    
+    def _chi_squared_counts(self, letter_counts: list[int]) -> float:
+        """
+        Compute chi-squared of a letter histogram against English frequencies.
         
-        # Use chi-squared test from our math helpers
-        try:
-            return chi_squared(letter_counts, expected)
-        except Exception:
+        Args:
+            letter_counts: List of 26 letter counts, indexed A=0 through Z=25
+        
+        Returns:
+            Chi-squared statistic (lower is better), inf if there are no letters
+        
+        Time Complexity: O(1) - always 26 terms
+        """
+        total_letters = sum(letter_counts)
+        
+        if total_letters == 0:
             return float('inf')
+        
+        expected = [share * total_letters for share in _EXPECTED_PROPORTIONS]
+        
+        return sum(
+            (observed - exp) ** 2 / exp
+            for observed, exp in zip(letter_counts, expected)
+        )
     
     def __repr__(self) -> str:
         """Return string representation."""
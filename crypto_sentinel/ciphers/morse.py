@@ -7,6 +7,8 @@ sequences of dots and dashes (or dits and dahs).
 Developer: saisrujanmurthy@gmail.com
 """
 
+from itertools import chain, repeat
+from types import MappingProxyType
 from typing import Any, Union
 from crypto_sentinel.core.base_cipher import CipherInterface
 from crypto_sentinel.core.exceptions import (
@@ -16,6 +18,43 @@ from crypto_sentinel.core.exceptions import (
 )
 
 
+# International Morse Code mapping
+_ENCODE = {
+    'A': '.-',    'B': '-...',  'C': '-.-.',  'D': '-..',   'E': '.',
+    'F': '..-.',  'G': '--.',   'H': '....',  'I': '..',    'J': '.---',
+    'K': '-.-',   'L': '.-..',  'M': '--',    'N': '-.',    'O': '---',
+    'P': '.--.',  'Q': '--.-',  'R': '.-.',   'S': '...',   'T': '-',
+    'U': '..-',   'V': '...-',  'W': '.--',   'X': '-..-',  'Y': '-.--',
+    'Z': '--..',
+    
+    '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-',
+    '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
+    
+    '.': '.-.-.-', ',': '--..--', '?': '..--..', "'": '.----.',
+    '!': '-.-.--', '/': '-..-.', '(': '-.--.', ')': '-.--.-',
+    '&': '.-...', ':': '---...', ';': '-.-.-.', '=': '-...-',
+    '+': '.-.-.', '-': '-....-', '_': '..--.-', '"': '.-..-.',
+    '$': '...-..-', '@': '.--.-.',
+}
+
+# Reverse mapping for decoding
+_DECODE = {v: k for k, v in _ENCODE.items()}
+
+# Read-only public views; the lookup is pre-bound on the underlying dict so
+# the decode loop avoids attribute lookups and the proxy indirection
+MORSE_CODE_DICT = MappingProxyType(_ENCODE)
+REVERSE_MORSE_DICT = MappingProxyType(_DECODE)
+_decode_get = _DECODE.get
+
+
+class _MorseEncodeTable(dict):
+    """str.translate table that deletes characters with no Morse encoding."""
+    
+    def __missing__(self, key: int) -> None:
+        """Map unknown ordinals to None so str.translate drops them."""
+        return None
+
+
 class MorseHandler(CipherInterface):
     """
     Morse Code encoder/decoder.
@@ -46,27 +85,29 @@ class MorseHandler(CipherInterface):
         'HELLO'
     """
     
-    # International Morse Code mapping
-    MORSE_CODE_DICT = {
-        'A': '.-',    'B': '-...',  'C': '-.-.',  'D': '-..',   'E': '.',
-        'F': '..-.',  'G': '--.',   'H': '....',  'I': '..',    'J': '.---',
-        'K': '-.-',   'L': '.-..',  'M': '--',    'N': '-.',    'O': '---',
-        'P': '.--.',  'Q': '--.-',  'R': '.-.',   'S': '...',   'T': '-',
-        'U': '..-',   'V': '...-',  'W': '.--',   'X': '-..-',  'Y': '-.--',
-        'Z': '--..',
-        
-        '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-',
-        '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
-        
-        '.': '.-.-.-', ',': '--..--', '?': '..--..', "'": '.----.',
-        '!': '-.-.--', '/': '-..-.', '(': '-.--.', ')': '-.--.-',
-        '&': '.-...', ':': '---...', ';': '-.-.-.', '=': '-...-',
-        '+': '.-.-.', '-': '-....-', '_': '..--.-', '"': '.-..-.',
-        '$': '...-..-', '@': '.--.-.',
-    }
+    # International Morse Code mapping (read-only)
+    MORSE_CODE_DICT = MORSE_CODE_DICT
+    
+    # Reverse mapping for decoding (read-only)
+    REVERSE_MORSE_DICT = REVERSE_MORSE_DICT
     
-    # Reverse mapping for decoding
-    REVERSE_MORSE_DICT = {v: k for k, v in MORSE_CODE_DICT.items()}
+    # Translation table for encoding: each character (and lowercase letter)
+    # maps to its code plus the trailing letter separator; unknown
+    # characters are dropped
+    _ENCODE_TABLE = _MorseEncodeTable(
+        {ord(k): v + ' ' for k, v in MORSE_CODE_DICT.items()}
+    )
+    _ENCODE_TABLE.update(
+        {ord(k.lower()): v + ' ' for k, v in MORSE_CODE_DICT.items() if k.isalpha()}
+    )
+    
+    # Audio timing for each Morse output symbol: (signal_type, duration) pairs
+    _PATTERN_MAP = {
+        '.': (('dit', 1.0), ('gap', 1.0)),
+        '-': (('dah', 3.0), ('gap', 1.0)),
+        ' ': (('gap', 3.0),),
+        '/': (('gap', 7.0),),
+    }
     
     def encrypt(self, data: Union[str, bytes], key: Any = None) -> Union[str, bytes]:
         """
@@ -112,24 +153,21 @@ class MorseHandler(CipherInterface):
             return ""
         
         try:
-            result = []
-            words = data.upper().split()
+            # The table handles both cases, so ASCII input skips the
+            # uppercased copy; non-ASCII input still needs upper() for its
+            # case mappings (e.g. 'ß' -> 'SS')
+            if not data.isascii():
+                data = data.upper()
             
-            for word in words:
-                morse_word = []
-                for char in word:
-                    if char in self.MORSE_CODE_DICT:
-                        morse_word.append(self.MORSE_CODE_DICT[char])
-                    else:
-                        # Unknown character, skip or use placeholder
-                        continue
-                
-                # Join letters with spaces
-                if morse_word:
-                    result.append(' '.join(morse_word) + ' ')
+            # Translate each word in a single C-level pass
+            morse_words = [
+                word.translate(self._ENCODE_TABLE)
+                for word in data.split()
+            ]
             
-            # Join words with ' / '
-            return ' / '.join(result) if len(result) > 1 else (result[0] if result else '')
+            # Join non-empty words with ' / ' (join materializes its input
+            # anyway, so hand it a list rather than a generator)
+            return ' / '.join([word for word in morse_words if word])
         
         except Exception as e:
             raise EncryptionError(
@@ -181,28 +219,14 @@ class MorseHandler(CipherInterface):
             return ""
         
         try:
-            result = []
-            
-            # Split by word separator ' / '
-            words = data.split(' / ')
-            
-            for word in words:
-                # Split by letter separator (space)
-                morse_chars = word.strip().split()
-                
-                decoded_word = []
-                for morse_char in morse_chars:
-                    if morse_char in self.REVERSE_MORSE_DICT:
-                        decoded_word.append(self.REVERSE_MORSE_DICT[morse_char])
-                    else:
-                        # Unknown Morse sequence, use '?' as placeholder
-                        if morse_char.strip():  # Only if not empty
-                            decoded_word.append('?')
-                
-                if decoded_word:
-                    result.append(''.join(decoded_word))
+            # Unknown Morse sequences decode to '?' as a placeholder
+            # Split by word separator ' / ', then by letter separator (space)
+            words = (
+                ''.join([_decode_get(morse_char, '?') for morse_char in word.split()])
+                for word in data.split(' / ')
+            )
             
-            return ' '.join(result)
+            return ' '.join(word for word in words if word)
         
         except Exception as e:
             raise DecryptionError(
@@ -304,21 +328,11 @@ class MorseHandler(CipherInterface):
             [('dit', 1), ('gap', 1), ('dit', 1), ('gap', 1), ('dit', 1), ...]
         """
         morse = self.encrypt(text, key=None)
-        pattern = []
-        
-        for char in morse:
-            if char == '.':
-                pattern.append(('dit', 1.0))
-                pattern.append(('gap', 1.0))
-            elif char == '-':
-                pattern.append(('dah', 3.0))
-                pattern.append(('gap', 1.0))
-            elif char == ' ':
-                pattern.append(('gap', 3.0))
-            elif char == '/':
-                pattern.append(('gap', 7.0))
-        
-        return pattern
+        
+        # One dict lookup per symbol; unknown symbols map to an empty run
+        return list(chain.from_iterable(
+            map(self._PATTERN_MAP.get, morse, repeat((), len(morse)))
+        ))
     
     def __repr__(self) -> str:
         """Return string representation."""
@@ -1,5 +1,5 @@
 """
-Substitution Cipher implementation with hill climbing cryptanalysis.
+Substitution Cipher implementation with simulated annealing cryptanalysis.
 
 A monoalphabetic substitution cipher that replaces each letter with
 another letter based on a permutation key.
@@ -7,6 +7,9 @@ another letter based on a permutation key.
 Developer: saisrujanmurthy@gmail.com
 """
 
+import functools
+import math
+import multiprocessing
 import random
 import string
 from typing import Any, Union
@@ -20,17 +23,67 @@ from crypto_sentinel.core.exceptions import (
 )
 
 
+def _build_trigram_lut(trigrams: dict[str, float]) -> list[int]:
+    """
+    Flatten trigram weights into a 26³ lookup table.
+    
+    Weights are scaled by 100 to integers so scores sum without float
+    rounding; entries longer than three letters can never match a
+    three-letter window and are skipped.
+    
+    Args:
+        trigrams: Mapping of uppercase trigram to relative frequency
+    
+    Returns:
+        List of 17576 ints indexed by (a * 26 + b) * 26 + c, A=0 through Z=25
+    """
+    lut = [0] * 26 ** 3
+    for trigram, freq in trigrams.items():
+        if len(trigram) != 3:
+            continue
+        a, b, c = (ord(char) - ord('A') for char in trigram)
+        lut[(a * 26 + b) * 26 + c] = round(freq * 100)
+    return lut
+
+
+_TablePair = tuple[dict[int, int], bytes]
+
+
+@functools.lru_cache(maxsize=128)
+def _translation_tables(key_upper: str) -> tuple[_TablePair, _TablePair]:
+    """
+    Build (and memoize) the encrypt and decrypt tables for a validated key.
+    
+    Each direction gets a str.translate table and the equivalent 256-byte
+    bytes.translate table for the ASCII fast path.
+    
+    Args:
+        key_upper: Uppercase 26-letter permutation
+    
+    Returns:
+        Tuple of (encrypt tables, decrypt tables), each (str table, bytes table)
+    """
+    plain = string.ascii_uppercase + string.ascii_lowercase
+    cipher = key_upper + key_upper.lower()
+    plain_bytes = plain.encode('ascii')
+    cipher_bytes = cipher.encode('ascii')
+    return (
+        (str.maketrans(plain, cipher), bytes.maketrans(plain_bytes, cipher_bytes)),
+        (str.maketrans(cipher, plain), bytes.maketrans(cipher_bytes, plain_bytes)),
+    )
+
+
 class SubstitutionCipher(CipherInterface):
     """
-    Substitution Cipher with hill climbing algorithm for cracking.
+    Substitution Cipher with simulated annealing for cracking.
     
     A monoalphabetic cipher where each letter is replaced with another
     letter based on a permutation of the alphabet.
     
     Features:
         - Encryption/Decryption with 26-letter permutation key
-        - Hill climbing algorithm with trigram scoring
-        - Simulated annealing for optimization
+        - Swap-based key search with trigram scoring
+        - Simulated annealing (Metropolis acceptance) to escape local optima
     
     Time Complexity:
         - Encrypt/Decrypt: O(n) where n is text length
@@ -62,6 +115,36 @@ class SubstitutionCipher(CipherInterface):
         'HIM': 0.16, 'WOU': 0.16, 'SAN': 0.16, 'ILL': 0.16, 'ERS': 0.16
     }
     
+    # Simulated annealing schedule, in units of the ciphertext's typical
+    # per-swap score change (the mean |delta| of SA_CALIBRATION_SWAPS random
+    # swaps): T = unit * SA_INITIAL_TEMP * SA_COOLING**epoch, cooling to
+    # unit * SA_FINAL_TEMP with the epochs spread evenly over the budget
+    SA_INITIAL_TEMP = 3.0
+    SA_FINAL_TEMP = 0.01
+    SA_COOLING = 0.95
+    SA_CALIBRATION_SWAPS = 20
+    
+    # Default swaps without improvement before an annealing run restarts
+    # from its best key; short patience keeps pulling a still-improving
+    # walk back and costs quality
+    RESTART_PATIENCE = 300
+    
+    # Integer trigram weights indexed by packed letter codes
+    _TRIGRAM_LUT = _build_trigram_lut(TRIGRAMS)
+    
+    # bytes.translate tables: delete non-letters, map A-Z/a-z to 0-25
+    _LETTER_INDEX = bytes.maketrans(
+        (ALPHABET + ALPHABET.lower()).encode('ascii'),
+        bytes(range(ALPHABET_SIZE)) * 2
+    )
+    _NON_LETTERS = bytes(
+        b for b in range(256) if not chr(b).isascii() or not chr(b).isalpha()
+    )
+    
+    # bytes.translate has less per-call overhead than str.translate on short
+    # ASCII input, while str.translate wins on long inputs
+    _BYTES_PATH_MAX = 4096
+    
     def encrypt(self, data: Union[str, bytes], key: Any) -> Union[str, bytes]:
         """
         Encrypt plaintext using substitution cipher.
@@ -90,51 +173,11 @@ class SubstitutionCipher(CipherInterface):
             >>> cipher.encrypt("HELLO WORLD", key=key)
             'ITSSG VGKSR'
         """
-        if isinstance(data, bytes):
-            raise ValidationError(
-                "Substitution cipher requires string input, not bytes",
-                details={"provided_type": "bytes"}
-            )
-        
-        if not isinstance(data, str):
-            raise ValidationError(
-                f"Data must be a string, got {type(data).__name__}",
-                details={"provided_type": type(data).__name__}
-            )
-        
-        # Validate key
-        if not isinstance(key, str):
-            raise InvalidKeyError(
-                f"Key must be a string, got {type(key).__name__}",
-                details={"provided_type": type(key).__name__}
-            )
-        
-        key_upper = key.upper()
-        
-        if len(key_upper) != self.ALPHABET_SIZE:
-            raise InvalidKeyError(
-                f"Key must be exactly {self.ALPHABET_SIZE} characters, got {len(key)}",
-                details={"key_length": len(key), "expected": self.ALPHABET_SIZE}
-            )
-        
-        if not all(c in self.ALPHABET for c in key_upper):
-            raise InvalidKeyError(
-                "Key must contain only alphabetic characters",
-                details={"key": key}
-            )
-        
-        if len(set(key_upper)) != self.ALPHABET_SIZE:
-            raise InvalidKeyError(
-                "Key must be a permutation (no duplicate letters)",
-                details={"key": key, "unique_chars": len(set(key_upper))}
-            )
+        key_upper = self._validate_inputs(data, key)
         
         try:
-            # Create substitution table
-            trans_table = str.maketrans(self.ALPHABET + self.ALPHABET.lower(),
-                                       key_upper + key_upper.lower())
-            
-            return data.translate(trans_table)
+            encrypt_tables, _ = _translation_tables(key_upper)
+            return self._encrypt_fast(data, encrypt_tables)
         
         except Exception as e:
             raise EncryptionError(
@@ -175,39 +218,50 @@ class SubstitutionCipher(CipherInterface):
                 details={"provided_type": type(key).__name__}
             )
         
+        key_upper = self._validate_inputs(data, key)
+        
         try:
-            # Create inverse key (reverse the permutation)
-            key_upper = key.upper()
-            inverse_key = [''] * self.ALPHABET_SIZE
-            
-            for i, char in enumerate(key_upper):
-                inverse_key[ord(char) - ord('A')] = self.ALPHABET[i]
-            
-            inverse_key_str = ''.join(inverse_key)
-            
-            # Decrypt using inverse key
-            return self.encrypt(data, inverse_key_str)
+            # The inverse permutation is the same table with sides swapped
+            _, decrypt_tables = _translation_tables(key_upper)
+            return self._encrypt_fast(data, decrypt_tables)
         
-        except EncryptionError as e:
+        except Exception as e:
             raise DecryptionError(
                 f"Failed to decrypt data: {e}",
                 details={"error": str(e), "key": key}
             )
     
-    def crack(self, data: Union[str, bytes]) -> dict[str, Any]:
+    def crack(
+        self,
+        data: Union[str, bytes],
+        workers: int = 1,
+        iterations: int = 2000,
+        restart_patience: int | None = None
+    ) -> dict[str, Any]:
         """
-        Crack substitution cipher using hill climbing algorithm.
+        Crack substitution cipher using simulated annealing.
         
         Algorithm:
         1. Start with a random key permutation
         2. Score the decryption using English trigram frequencies
         3. Swap two random letters in the key
-        4. If score improves, keep the swap; otherwise, revert
-        5. Repeat for many iterations (1000+)
-        6. Return best key found
+        4. Keep the swap if the score improves; keep a worse swap with
+           probability exp(delta / T) (Metropolis criterion), else revert
+        5. Cool T geometrically from SA_INITIAL_TEMP to SA_FINAL_TEMP,
+           both scaled by the mean score change of a few random swaps
+        6. If a run has not improved for restart_patience swaps, return
+           to the best key found so far and continue cooling from there
+        7. Return best key found
+        
+        With workers > 1, that many independent annealers run in a process
+        pool, splitting the iteration budget, and the best result wins.
         
         Args:
             data: Ciphertext string to crack
+            workers: Number of parallel annealing processes (default 1)
+            iterations: Total candidate swaps across all workers (default 2000)
+            restart_patience: Swaps without improvement before a restart
+                (default RESTART_PATIENCE)
         
         Returns:
             Dictionary containing:
@@ -220,7 +274,8 @@ class SubstitutionCipher(CipherInterface):
                 - best_score: float
         
         Raises:
-            ValidationError: If input data is invalid
+            ValidationError: If input data, workers, iterations or
+                restart_patience is invalid
             CrackingError: If cracking process fails
         
         Time Complexity: O(iterations * n) where n is text length
@@ -243,6 +298,17 @@ class SubstitutionCipher(CipherInterface):
                 details={"provided_type": type(data).__name__}
             )
         
+        self._check_positive_int("workers", workers)
+        self._check_positive_int("iterations", iterations)
+        
+        if restart_patience is None:
+            restart_patience = self.RESTART_PATIENCE
+        else:
+            self._check_positive_int("restart_patience", restart_patience)
+        
+        # Every annealer needs at least one iteration of the budget
+        workers = min(workers, iterations)
+        
         # Filter to alphabetic characters
         filtered_text = ''.join(c.upper() for c in data if c.isalpha())
         
@@ -252,59 +318,42 @@ class SubstitutionCipher(CipherInterface):
                 'key': None,
                 'plaintext': None,
                 'confidence': 0.0,
-                'method': 'hill_climbing',
+                'method': 'simulated_annealing',
                 'attempts': 0,
                 'error': 'Text too short for reliable analysis (minimum 50 letters)'
             }
         
         try:
-            # Hill climbing parameters
-            iterations = 2000
-            best_key = list(self.ALPHABET)
-            random.shuffle(best_key)
-            best_key = ''.join(best_key)
-            best_score = self._score_trigrams(self.decrypt(data, best_key))
-            
-            current_key = best_key
-            current_score = best_score
-            
-            attempts = 0
-            no_improvement_count = 0
+            # Stage the ciphertext once as letter indices; each annealer
+            # only ever gathers through this buffer
+            cipher_idx = self._letter_indices(data)
             
-            for iteration in range(iterations):
-                # Try swapping two random positions
-                key_list = list(current_key)
-                pos1, pos2 = random.sample(range(self.ALPHABET_SIZE), 2)
-                key_list[pos1], key_list[pos2] = key_list[pos2], key_list[pos1]
-                new_key = ''.join(key_list)
-                
-                # Score the new key
-                try:
-                    decrypted = self.decrypt(data, new_key)
-                    new_score = self._score_trigrams(decrypted)
-                except Exception:
-                    continue
-                
-                attempts += 1
+            if workers == 1:
+                best_inv, best_score, attempts = self._anneal(
+                    cipher_idx, iterations, random, restart_patience
+                )
+            else:
+                # Independent annealers split the budget; each gets its own
+                # seed so forked workers do not replay the same random stream
+                seeds = [random.randrange(2 ** 32) for _ in range(workers)]
+                climb = functools.partial(
+                    _anneal_worker,
+                    type(self),
+                    cipher_idx,
+                    iterations // workers,
+                    restart_patience
+                )
+                with multiprocessing.Pool(workers) as pool:
+                    results = pool.map(climb, seeds)
                 
-                # Accept if better
-                if new_score > current_score:
-                    current_key = new_key
-                    current_score = new_score
-                    no_improvement_count = 0
-                    
-                    # Update best if this is best so far
-                    if new_score > best_score:
-                        best_key = new_key
-                        best_score = new_score
-                else:
-                    no_improvement_count += 1
-                
-                # Restart from best if stuck
-                if no_improvement_count > 100:
-                    current_key = best_key
-                    current_score = best_score
-                    no_improvement_count = 0
+                best_inv, best_score, _ = max(results, key=lambda result: result[1])
+                attempts = sum(result[2] for result in results)
+            
+            # Invert the decryption table back into an encryption key
+            key_chars = [''] * self.ALPHABET_SIZE
+            for cipher_pos in range(self.ALPHABET_SIZE):
+                key_chars[best_inv[cipher_pos]] = self.ALPHABET[cipher_pos]
+            best_key = ''.join(key_chars)
             
             # Decrypt with best key found
             plaintext = self.decrypt(data, best_key)
@@ -318,7 +367,7 @@ class SubstitutionCipher(CipherInterface):
                 'key': best_key,
                 'plaintext': plaintext,
                 'confidence': round(confidence, 4),
-                'method': 'hill_climbing',
+                'method': 'simulated_annealing',
                 'attempts': attempts,
                 'best_score': round(best_score, 4),
                 'iterations': iterations
@@ -348,6 +397,9 @@ class SubstitutionCipher(CipherInterface):
         if not text or len(text) < 3:
             return 0.0
         
+        if text.isascii():
+            return self._score_indices(self._letter_indices(text))
+        
         # Filter to uppercase alphabetic
         filtered = ''.join(c for c in text.upper() if c.isalpha())
         
@@ -369,6 +421,345 @@ class SubstitutionCipher(CipherInterface):
         
         return score
     
+    @staticmethod
+    def _check_positive_int(name: str, value: Any) -> None:
+        """
+        Require a positive int (bool is rejected despite subclassing int).
+        
+        Args:
+            name: Parameter name, for the error message
+            value: Value to check
+        
+        Raises:
+            ValidationError: If value is not a positive integer
+        """
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValidationError(
+                f"{name} must be a positive integer, got {value!r}",
+                details={name: value}
+            )
+    
+    def _validate_inputs(self, data: Any, key: Any) -> str:
+        """
+        Validate cipher input and key, returning the normalized key.
+        
+        Args:
+            data: Text passed to encrypt/decrypt
+            key: Key passed to encrypt/decrypt
+        
+        Returns:
+            Uppercase 26-letter permutation key
+        
+        Raises:
+            ValidationError: If data is not a string
+            InvalidKeyError: If key is not a 26-letter permutation
+        """
+        if isinstance(data, bytes):
+            raise ValidationError(
+                "Substitution cipher requires string input, not bytes",
+                details={"provided_type": "bytes"}
+            )
+        
+        if not isinstance(data, str):
+            raise ValidationError(
+                f"Data must be a string, got {type(data).__name__}",
+                details={"provided_type": type(data).__name__}
+            )
+        
+        # Validate key
+        if not isinstance(key, str):
+            raise InvalidKeyError(
+                f"Key must be a string, got {type(key).__name__}",
+                details={"provided_type": type(key).__name__}
+            )
+        
+        key_upper = key.upper()
+        
+        if len(key_upper) != self.ALPHABET_SIZE:
+            raise InvalidKeyError(
+                f"Key must be exactly {self.ALPHABET_SIZE} characters, got {len(key)}",
+                details={"key_length": len(key), "expected": self.ALPHABET_SIZE}
+            )
+        
+        # After upper(), an ASCII alphabetic string can only hold A-Z, so two
+        # C-level scans replace the per-character ALPHABET membership test
+        if not (key_upper.isascii() and key_upper.isalpha()):
+            raise InvalidKeyError(
+                "Key must contain only alphabetic characters",
+                details={"key": key}
+            )
+        
+        unique_chars = len(set(key_upper))
+        if unique_chars != self.ALPHABET_SIZE:
+            raise InvalidKeyError(
+                "Key must be a permutation (no duplicate letters)",
+                details={"key": key, "unique_chars": unique_chars}
+            )
+        
+        return key_upper
+    
+    def _encrypt_fast(self, data: str, tables: _TablePair) -> str:
+        """
+        Apply prebuilt translation tables without any input checks.
+        
+        Args:
+            data: Validated text
+            tables: One direction's (str table, bytes table) from
+                _translation_tables
+        
+        Returns:
+            Translated string
+        """
+        trans_table, byte_table = tables
+        
+        # Short ASCII input: translate the raw byte buffer instead
+        if len(data) <= self._BYTES_PATH_MAX and data.isascii():
+            return data.encode('ascii').translate(byte_table).decode('ascii')
+        
+        return data.translate(trans_table)
+    
+    def _anneal(
+        self,
+        cipher_idx: bytes,
+        iterations: int,
+        rng: Any,
+        restart_patience: int | None = None
+    ) -> tuple[bytes, float, int]:
+        """
+        Run one simulated annealing search over decryption keys.
+        
+        The key is held as its inverse (cipher index -> plain index) in a
+        256-byte translate table, so each candidate is one C-level gather
+        over the staged ciphertext.
+        
+        Args:
+            cipher_idx: Ciphertext letter indices (see _letter_indices)
+            iterations: Number of candidate swaps to evaluate
+            rng: Random source providing shuffle and random
+            restart_patience: Swaps without improving the current run's best
+                before returning to the best key (default RESTART_PATIENCE)
+        
+        Returns:
+            Tuple of (best inverse table, best score, swaps evaluated)
+        
+        Time Complexity: O(iterations * n) where n is number of letters
+        """
+        if restart_patience is None:
+            restart_patience = self.RESTART_PATIENCE
+        
+        # The cooling epochs share the iteration budget
+        epochs = math.ceil(
+            math.log(self.SA_FINAL_TEMP / self.SA_INITIAL_TEMP)
+            / math.log(self.SA_COOLING)
+        )
+        swaps_per_epoch = max(1, iterations // epochs)
+        
+        size = self.ALPHABET_SIZE
+        num_trigrams = len(cipher_idx) - 2
+        
+        # Trigram windows (by start position) touching each cipher letter;
+        # a swap only changes the windows of the two letters involved
+        letter_windows = [set() for _ in range(size)]
+        for pos, letter in enumerate(cipher_idx):
+            letter_windows[letter].update(
+                range(max(0, pos - 2), min(pos, num_trigrams - 1) + 1)
+            )
+        pair_windows: dict[tuple[int, int], tuple[int, ...]] = {}
+        
+        start = list(range(size))
+        rng.shuffle(start)
+        current_inv = bytearray(start) + bytearray(256 - size)
+        current_plain = cipher_idx.translate(current_inv)
+        
+        # Integer LUT sum over all windows; score is total / num_trigrams
+        lut = self._TRIGRAM_LUT
+        
+        def full_total(plain: bytes) -> int:
+            return sum([
+                lut[a * 676 + b * 26 + c]
+                for a, b, c in zip(plain, plain[1:], plain[2:])
+            ])
+        
+        current_total = full_total(current_plain)
+        score_scale = 1.0 / num_trigrams if num_trigrams > 0 else 0.0
+        
+        best_inv = bytes(current_inv)
+        best_total = current_total
+        
+        # Calibrate the temperature to this ciphertext: score changes per
+        # swap vary with its length and letter mix, and a fixed T either
+        # random-walks (too hot) or freezes (too cold)
+        probe = bytearray(current_inv)
+        delta_sum = 0
+        for _ in range(self.SA_CALIBRATION_SWAPS):
+            pos1, pos2 = rng.sample(range(size), 2)
+            probe[pos1], probe[pos2] = probe[pos2], probe[pos1]
+            delta_sum += abs(full_total(cipher_idx.translate(probe)) - current_total)
+            probe[pos1], probe[pos2] = probe[pos2], probe[pos1]
+        
+        unit = delta_sum * score_scale / self.SA_CALIBRATION_SWAPS or 1.0
+        temperature = unit * self.SA_INITIAL_TEMP
+        
+        # Progress of the current run, for deciding when to restart
+        run_best_total = current_total
+        stale = 0
+        
+        # Bind everything the loop touches to locals; the loop body is the
+        # whole cost of a crack, so attribute lookups add up
+        translate = cipher_idx.translate
+        rand = rng.random
+        exp = math.exp
+        cooling = self.SA_COOLING
+        
+        # Metropolis acceptance probability per integer total change at the
+        # current temperature; a swap only moves a few small LUT weights, so
+        # the same handful of deltas recur and exp() runs once for each
+        acceptance: dict[int, float] = {}
+        
+        attempts = 0
+        
+        for iteration in range(1, iterations + 1):
+            # Try swapping two distinct random positions (in place)
+            pos1 = int(rand() * size)
+            pos2 = int(rand() * (size - 1))
+            if pos2 >= pos1:
+                pos2 += 1
+            current_inv[pos1], current_inv[pos2] = current_inv[pos2], current_inv[pos1]
+            
+            # Rescore only the windows touching the swapped letters
+            pair = (pos1, pos2) if pos1 < pos2 else (pos2, pos1)
+            windows = pair_windows.get(pair)
+            if windows is None:
+                windows = tuple(letter_windows[pos1] | letter_windows[pos2])
+                pair_windows[pair] = windows
+            
+            new_plain = translate(current_inv)
+            old = current_plain
+            new_total = current_total + sum([
+                lut[new_plain[i] * 676 + new_plain[i + 1] * 26 + new_plain[i + 2]]
+                - lut[old[i] * 676 + old[i + 1] * 26 + old[i + 2]]
+                for i in windows
+            ])
+            
+            attempts += 1
+            
+            # Accept if better, or by the Metropolis criterion if worse
+            gain = new_total - current_total
+            if gain > 0:
+                accept = True
+            else:
+                threshold = acceptance.get(gain)
+                if threshold is None:
+                    threshold = exp(gain * score_scale / temperature)
+                    acceptance[gain] = threshold
+                accept = rand() < threshold
+            
+            if accept:
+                current_plain = new_plain
+                current_total = new_total
+                
+                # Update best if this is best so far
+                if new_total > best_total:
+                    best_inv = bytes(current_inv)
+                    best_total = new_total
+            else:
+                # Revert the swap
+                current_inv[pos1], current_inv[pos2] = current_inv[pos2], current_inv[pos1]
+            
+            # Once this run stalls, drop back to the best key so far; the
+            # cooling schedule carries on from the current temperature
+            if current_total > run_best_total:
+                run_best_total = current_total
+                stale = 0
+            else:
+                stale += 1
+                if stale >= restart_patience:
+                    current_inv[:] = best_inv
+                    current_plain = translate(current_inv)
+                    current_total = best_total
+                    run_best_total = current_total
+                    stale = 0
+            
+            # Cool down at the end of each epoch
+            if iteration % swaps_per_epoch == 0:
+                temperature *= cooling
+                acceptance.clear()
+        
+        best_score = best_total * score_scale
+        
+        return best_inv, best_score, attempts
+    
+    def _letter_indices(self, text: str) -> bytes:
+        """
+        Reduce text to its ASCII letters as indices 0-25.
+        
+        Filtering, case folding and indexing happen in one bytes.translate
+        pass. Non-ASCII characters are dropped.
+        
+        Args:
+            text: Text to convert
+        
+        Returns:
+            Bytes of letter indices, A=0 through Z=25
+        
+        Time Complexity: O(n) where n is text length
+        """
+        if not text.isascii():
+            text = text.upper().encode('ascii', 'ignore').decode('ascii')
+        
+        return text.encode('ascii').translate(self._LETTER_INDEX, self._NON_LETTERS)
+    
+    def _score_indices(self, letters: bytes) -> float:
+        """
+        Score a letter-index sequence by English trigram frequencies.
+        
+        Args:
+            letters: Letter indices 0-25 (see _letter_indices)
+        
+        Returns:
+            Score (higher is better), same scale as _score_trigrams
+        
+        Time Complexity: O(n) where n is number of letters
+        """
+        num_trigrams = len(letters) - 2
+        
+        if num_trigrams < 1:
+            return 0.0
+        
+        lut = self._TRIGRAM_LUT
+        total = sum([
+            lut[a * 676 + b * 26 + c]
+            for a, b, c in zip(letters, letters[1:], letters[2:])
+        ])
+        
+        # Weights are pre-scaled by 100
+        return total / num_trigrams
+    
     def __repr__(self) -> str:
         """Return string representation."""
         return "SubstitutionCipher()"
+
+
+def _anneal_worker(
+    cipher_cls: type[SubstitutionCipher],
+    cipher_idx: bytes,
+    iterations: int,
+    restart_patience: int,
+    seed: int
+) -> tuple[bytes, float, int]:
+    """
+    Process-pool entry point running one seeded annealer.
+    
+    Args:
+        cipher_cls: SubstitutionCipher (or subclass) providing the scoring
+        cipher_idx: Ciphertext letter indices
+        iterations: Number of candidate swaps for this worker
+        restart_patience: Swaps without improvement before a restart
+        seed: Seed for this worker's private random stream
+    
+    Returns:
+        Tuple of (best inverse table, best score, swaps evaluated)
+    """
+    return cipher_cls()._anneal(
+        cipher_idx, iterations, random.Random(seed), restart_patience
+    )
@@ -7,6 +7,9 @@ a keyword to shift letters by different amounts.
 Developer: saisrujanmurthy@gmail.com
 """
 
+import re
+import string
+from collections import Counter
 from typing import Any, Union
 from crypto_sentinel.core.base_cipher import CipherInterface
 from crypto_sentinel.core.exceptions import (
@@ -16,7 +19,14 @@ from crypto_sentinel.core.exceptions import (
     ValidationError,
     CrackingError,
 )
-from crypto_sentinel.utils.math_helpers import calculate_ioc, chi_squared
+from crypto_sentinel.utils.math_helpers import chi_squared
+
+
+# Splits text into alternating letter runs and non-letter separators
+_NON_LETTER_RUNS = re.compile(r'([^A-Za-z]+)')
+
+# Matches any letter outside A-Z/a-z (a superset of non-ASCII isalpha())
+_NON_ASCII_LETTER = re.compile(r'[^\W\d_A-Za-z]')
 
 
 class VigenereCipher(CipherInterface):
@@ -54,6 +64,23 @@ class VigenereCipher(CipherInterface):
         6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074
     ]
     
+    # str.translate tables shifting ASCII letters by 0-25 positions
+    _SHIFT_TABLES = [
+        str.maketrans(
+            string.ascii_uppercase + string.ascii_lowercase,
+            string.ascii_uppercase[shift:] + string.ascii_uppercase[:shift]
+            + string.ascii_lowercase[shift:] + string.ascii_lowercase[:shift]
+        )
+        for shift in range(26)
+    ]
+    
+    # Case base per Latin-1 code point: ord('A') for uppercase letters,
+    # ord('a') for other letters, 0 for non-letters
+    _CHAR_BASE = tuple(
+        (ord('A') if chr(code).isupper() else ord('a')) if chr(code).isalpha() else 0
+        for code in range(256)
+    )
+    
     def encrypt(self, data: Union[str, bytes], key: Any) -> Union[str, bytes]:
         """
         Encrypt plaintext using Vigenère cipher.
@@ -107,20 +134,31 @@ class VigenereCipher(CipherInterface):
             )
         
         try:
-            result = []
             key_upper = key.upper()
+            
+            # Only non-ASCII letters need the per-character path
+            if data.isascii() or _NON_ASCII_LETTER.search(data) is None:
+                return self._encrypt_ascii(data, key_upper)
+            
+            result = []
             key_index = 0
+            shifts = [ord(c) - ord('A') for c in key_upper]
+            key_length = len(shifts)
+            char_base = self._CHAR_BASE
             
             for char in data:
-                if char.isalpha():
-                    # Determine base (uppercase or lowercase)
+                # Determine base (uppercase or lowercase, 0 for non-letters)
+                code = ord(char)
+                if code < 256:
+                    base = char_base[code]
+                elif char.isalpha():
                     base = ord('A') if char.isupper() else ord('a')
-                    
-                    # Get shift from key
-                    shift = ord(key_upper[key_index % len(key_upper)]) - ord('A')
-                    
-                    # Apply shift
-                    shifted = (ord(char) - base + shift) % self.ALPHABET_SIZE
+                else:
+                    base = 0
+                
+                if base:
+                    # Apply shift from key
+                    shifted = (code - base + shifts[key_index % key_length]) % self.ALPHABET_SIZE
                     result.append(chr(base + shifted))
                     
                     # Move to next key character
@@ -137,6 +175,63 @@ class VigenereCipher(CipherInterface):
                 details={"error": str(e), "key": key}
             )
     
+    def _encrypt_ascii(self, data: str, key_upper: str) -> str:
+        """
+        Encrypt text with whole-slice translations instead of a char loop.
+        
+        The key advances only on letters, so the letters are pulled out
+        into one string, every m-th letter (m = key length) is shifted with
+        a single str.translate call, and the result is spliced back between
+        the untouched non-letter runs.
+        
+        Args:
+            data: Validated plaintext whose only letters are A-Z/a-z
+            key_upper: Validated uppercase key
+        
+        Returns:
+            Encrypted ciphertext string
+        
+        Time Complexity: O(n + m) where n is text length, m is key length
+        """
+        shifts = [(ord(c) - ord('A')) % self.ALPHABET_SIZE for c in key_upper]
+        
+        # Even indices are letter runs, odd indices the separators between
+        return self._shift_runs(_NON_LETTER_RUNS.split(data), shifts)
+    
+    def _shift_runs(self, parts: list[str], shifts: list[int]) -> str:
+        """
+        Shift the letter runs of pre-split text and join it back together.
+        
+        Args:
+            parts: _NON_LETTER_RUNS.split() output; letter runs at even
+                indices are replaced in place
+            shifts: Per-key-position shifts, each 0-25
+        
+        Returns:
+            Shifted text with separators untouched
+        
+        Time Complexity: O(n + m) where n is text length, m is key length
+        """
+        period = len(shifts)
+        letters = ''.join(parts[0::2])
+        
+        # Shift each key column of the letter stream in one pass
+        chars = list(letters)
+        for column, shift in enumerate(shifts):
+            chars[column::period] = letters[column::period].translate(
+                self._SHIFT_TABLES[shift]
+            )
+        shifted = ''.join(chars)
+        
+        # Cut the shifted letters back into the original run lengths
+        pos = 0
+        for i in range(0, len(parts), 2):
+            run_length = len(parts[i])
+            parts[i] = shifted[pos:pos + run_length]
+            pos += run_length
+        
+        return ''.join(parts)
+    
     def decrypt(self, data: Union[str, bytes], key: Any) -> Union[str, bytes]:
         """
         Decrypt ciphertext using Vigenère cipher.
@@ -233,8 +328,14 @@ class VigenereCipher(CipherInterface):
                 details={"provided_type": type(data).__name__}
             )
         
-        # Filter to alphabetic characters only
-        filtered_text = ''.join(c.upper() for c in data if c.isalpha())
+        # Filter to alphabetic characters only; for A-Z/a-z letters keep the
+        # split so the plaintext can be rebuilt without rescanning the data
+        if data.isascii() or _NON_ASCII_LETTER.search(data) is None:
+            parts = _NON_LETTER_RUNS.split(data)
+            filtered_text = ''.join(parts[0::2]).upper()
+        else:
+            parts = None
+            filtered_text = ''.join(c.upper() for c in data if c.isalpha())
         
         if len(filtered_text) < 20:
             return {
@@ -269,32 +370,13 @@ class VigenereCipher(CipherInterface):
                 columns[i % key_length] += char
             
             # Step 3: Solve each column as Caesar cipher
+            # Columns are independent; each solve is a short pure-Python
+            # computation, so a plain map beats thread dispatch under the GIL
             key_chars = []
             total_confidence = 0.0
             
-            for column in columns:
-                if not column:
-                    key_chars.append('A')
-                    continue
-                
-                best_shift = 0
-                best_score = float('inf')
-                
-                for shift in range(self.ALPHABET_SIZE):
-                    # Decrypt column with this shift
-                    decrypted = ''.join(
-                        chr((ord(c) - ord('A') - shift) % self.ALPHABET_SIZE + ord('A'))
-                        for c in column
-                    )
-                    score = self._score_text(decrypted)
-                    
-                    if score < best_score:
-                        best_score = score
-                        best_shift = shift
-                
-                key_chars.append(chr(best_shift + ord('A')))
-                # Calculate confidence for this column
-                confidence = max(0.0, min(1.0, 1.0 - (best_score / 500.0)))
+            for key_char, confidence in map(self._solve_column, columns):
+                key_chars.append(key_char)
                 total_confidence += confidence
             
             # Step 4: Reassemble key
@@ -302,7 +384,14 @@ class VigenereCipher(CipherInterface):
             
             # Decrypt with found key
             try:
-                plaintext = self.decrypt(data, key)
+                if parts is not None:
+                    inverse_shifts = [
+                        (self.ALPHABET_SIZE - (ord(c) - ord('A'))) % self.ALPHABET_SIZE
+                        for c in key
+                    ]
+                    plaintext = self._shift_runs(parts, inverse_shifts)
+                else:
+                    plaintext = self.decrypt(data, key)
                 avg_confidence = total_confidence / len(key_chars) if key_chars else 0.0
                 
                 return {
@@ -347,23 +436,23 @@ class VigenereCipher(CipherInterface):
         best_score = float('inf')
         
         for length in range(1, min(max_length + 1, len(text) // 2)):
-            # Split into columns
-            columns = [''] * length
-            for i, char in enumerate(text):
-                columns[i % length] += char
-            
-            # Calculate average IoC for columns
+            # Calculate average IoC for columns; each column is a stride
+            # slice of the already-filtered text
             ioc_sum = 0.0
             valid_columns = 0
             
-            for column in columns:
-                if len(column) >= 2:
-                    try:
-                        ioc = calculate_ioc(column)
-                        ioc_sum += ioc
-                        valid_columns += 1
-                    except Exception:
-                        continue
+            for offset in range(length):
+                column = text[offset::length]
+                column_length = len(column)
+                
+                if column_length >= 2:
+                    numerator = sum(
+                        count * (count - 1) for count in Counter(column).values()
+                    )
+                    # Same rounding as calculate_ioc, so the chosen length
+                    # does not change
+                    ioc_sum += round(numerator / (column_length * (column_length - 1)), 6)
+                    valid_columns += 1
             
             if valid_columns > 0:
                 avg_ioc = ioc_sum / valid_columns
@@ -377,6 +466,69 @@ class VigenereCipher(CipherInterface):
         
         return best_length
     
+    def _solve_column(self, column: str) -> tuple[str, float]:
+        """
+        Solve one key column as a Caesar cipher.
+        
+        Args:
+            column: Uppercase letters sharing one key position
+        
+        Returns:
+            Tuple of (key letter, confidence 0-1); ('A', 0.0) for an empty column
+        
+        Time Complexity: O(n + 26²) where n is column length
+        """
+        if not column:
+            return 'A', 0.0
+        
+        # Score all 26 shifts from one histogram; min() keeps the
+        # first (smallest) shift on ties
+        shift_scores = self._column_shift_scores(column)
+        best_shift = min(range(self.ALPHABET_SIZE), key=shift_scores.__getitem__)
+        best_score = shift_scores[best_shift]
+        
+        confidence = max(0.0, min(1.0, 1.0 - (best_score / 500.0)))
+        return chr(best_shift + ord('A')), confidence
+    
+    def _column_shift_scores(self, column: str) -> list[float]:
+        """
+        Chi-squared score of every Caesar shift of one key column.
+        
+        Decrypting with shift k turns column letter (i + k) into letter i,
+        so the decrypted histogram is the column histogram rotated by k;
+        the column is counted once instead of decrypted 26 times.
+        
+        Args:
+            column: Uppercase letters sharing one key position
+        
+        Returns:
+            List of 26 chi-squared scores indexed by shift
+        
+        Time Complexity: O(n + 26²) where n is column length
+        """
+        size = self.ALPHABET_SIZE
+        
+        histogram = [0] * size
+        for char, count in Counter(column).items():
+            histogram[(ord(char) - ord('A')) % size] += count
+        
+        total_letters = len(column)
+        expected = [
+            (freq / 100.0) * total_letters
+            for freq in self.ENGLISH_FREQ
+        ]
+        
+        # Rotation by slicing a doubled histogram: no per-term modulo
+        doubled = histogram + histogram
+        
+        return [
+            sum(
+                ((observed - exp) ** 2) / exp
+                for observed, exp in zip(doubled[shift:shift + size], expected)
+            )
+            for shift in range(size)
+        ]
+    
     def _score_text(self, text: str) -> float:
         """
         Score text using chi-squared test against English frequencies.
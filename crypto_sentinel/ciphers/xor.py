@@ -7,16 +7,84 @@ meaning the same operation is used for both encryption and decryption.
 Developer: saisrujanmurthy@gmail.com
 """
 
-from typing import Any, Union
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Union
 from crypto_sentinel.core.base_cipher import CipherInterface
 from crypto_sentinel.core.exceptions import (
     EncryptionError,
     DecryptionError,
+    FileOperationError,
     InvalidKeyError,
     ValidationError,
 )
 
 
+_IDENTITY_TABLE = int.from_bytes(bytes(range(256)), 'little')
+
+
+def _build_xor_table(key: int) -> bytes:
+    """
+    Build the bytes.translate table XORing every byte with key.
+    
+    The identity table is XORed with the key as one big integer, which
+    keeps building all 256 tables at class load cheap.
+    
+    Args:
+        key: Single-byte key (0-255)
+    
+    Returns:
+        256-byte table where table[b] == b ^ key
+    """
+    key_stream = int.from_bytes(bytes([key]) * 256, 'little')
+    return (_IDENTITY_TABLE ^ key_stream).to_bytes(256, 'little')
+
+
+def _key_bytes(key: Any) -> bytes:
+    """
+    Validate an XOR key and convert it to its byte form.
+    
+    Args:
+        key: Integer key (0-255), bytes key or str key (UTF-8 encoded)
+    
+    Returns:
+        Non-empty key bytes
+    
+    Raises:
+        InvalidKeyError: If key is invalid
+    """
+    if isinstance(key, int):
+        if not 0 <= key <= 255:
+            raise InvalidKeyError(
+                f"Integer key must be in range [0, 255], got {key}",
+                details={"key": key, "valid_range": "0-255"}
+            )
+        key_bytes = bytes([key])
+    elif isinstance(key, bytes):
+        if len(key) == 0:
+            raise InvalidKeyError(
+                "Bytes key cannot be empty",
+                details={"key_length": 0}
+            )
+        key_bytes = key
+    elif isinstance(key, str):
+        # Convert string key to bytes
+        key_bytes = key.encode('utf-8')
+        if len(key_bytes) == 0:
+            raise InvalidKeyError(
+                "String key cannot be empty",
+                details={"key": key}
+            )
+    else:
+        raise InvalidKeyError(
+            f"Key must be int, bytes, or str, got {type(key).__name__}",
+            details={"provided_type": type(key).__name__}
+        )
+    
+    return key_bytes
+
+
 class XORCipher(CipherInterface):
     """
     XOR Cipher with support for both string and byte operations.
@@ -27,8 +95,9 @@ class XORCipher(CipherInterface):
     Features:
         - String encryption (returns hex output)
         - Raw byte encryption (for file encryption)
-        - Single-byte key brute force (0-255)
+        - Single-byte key brute force (0-255), singly or in batches
         - Key repetition for longer plaintexts
+        - Chunked stream and file encryption for large payloads
     
     Time Complexity:
         - Encrypt/Decrypt: O(n) where n is data length
@@ -54,7 +123,40 @@ class XORCipher(CipherInterface):
         'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their', 'what'
     }
     
-    def encrypt(self, data: Union[str, bytes], key: Any) -> Union[str, bytes]:
+    CHUNK_SIZE: int = 65536  # 64KB chunks for streaming
+    
+    # Accepted values of encrypt()'s output argument
+    OUTPUT_FORMATS = ('auto', 'hex', 'bytes')
+    
+    # bytes.translate table per single-byte key (64 KiB, built once)
+    _XOR_TABLES = tuple(_build_xor_table(key) for key in range(256))
+    
+    # bytes.translate delete sets for classifying ASCII text
+    _ASCII_NON_PRINTABLE = bytes(
+        code for code in range(128)
+        if not (chr(code).isprintable() or chr(code) in '\n\r\t')
+    )
+    _ASCII_NON_ALPHA = bytes(code for code in range(128) if not chr(code).isalpha())
+    
+    # UTF-8 role of each byte: a(scii), c(ontinuation), l(ead) or x (never
+    # valid); a byte set with an x, or with c but no l (or l but no c),
+    # cannot decode
+    _UTF8_BYTE_CLASSES = (
+        b'a' * 0x80 + b'c' * 0x40 + b'x' * 2 + b'l' * 0x33 + b'x' * 0x0B
+    )
+    
+    # Per-character _score_plaintext weights for ASCII code points:
+    # printable +1 (else -5), alphabetic +2, space +1
+    _ASCII_CHAR_SCORES = tuple(
+        (1 if chr(code).isprintable() or chr(code) in '\n\r\t' else -5)
+        + (2 if chr(code).isalpha() else 0)
+        + (1 if code == ord(' ') else 0)
+        for code in range(128)
+    )
+    
+    def encrypt(
+        self, data: Union[str, bytes], key: Any, *, output: str = 'auto'
+    ) -> Union[str, bytes]:
         """
         Encrypt data using XOR cipher.
         
@@ -65,15 +167,18 @@ class XORCipher(CipherInterface):
         Args:
             data: Plaintext (string or bytes) to encrypt
             key: Integer key (0-255) or bytes key
+            output: 'auto' (hex for string input, bytes for bytes input),
+                'hex' or 'bytes'; 'bytes' skips the hex encoding pass
         
         Returns:
             For string input: Hex string of encrypted bytes
             For bytes input: Encrypted bytes
+            (unless overridden by output)
         
         Raises:
             InvalidKeyError: If key is invalid
             EncryptionError: If encryption fails
-            ValidationError: If data is invalid
+            ValidationError: If data or output is invalid
         
         Time Complexity: O(n) where n is length of data
         Space Complexity: O(n) for output
@@ -86,32 +191,12 @@ class XORCipher(CipherInterface):
             b'bW\\\\\\]'
         """
         # Validate and normalize key
-        if isinstance(key, int):
-            if not 0 <= key <= 255:
-                raise InvalidKeyError(
-                    f"Integer key must be in range [0, 255], got {key}",
-                    details={"key": key, "valid_range": "0-255"}
-                )
-            key_bytes = bytes([key])
-        elif isinstance(key, bytes):
-            if len(key) == 0:
-                raise InvalidKeyError(
-                    "Bytes key cannot be empty",
-                    details={"key_length": 0}
-                )
-            key_bytes = key
-        elif isinstance(key, str):
-            # Convert string key to bytes
-            key_bytes = key.encode('utf-8')
-            if len(key_bytes) == 0:
-                raise InvalidKeyError(
-                    "String key cannot be empty",
-                    details={"key": key}
-                )
-        else:
-            raise InvalidKeyError(
-                f"Key must be int, bytes, or str, got {type(key).__name__}",
-                details={"provided_type": type(key).__name__}
+        key_bytes = _key_bytes(key)
+        
+        if output not in self.OUTPUT_FORMATS:
+            raise ValidationError(
+                f"output must be one of {', '.join(self.OUTPUT_FORMATS)}, got {output!r}",
+                details={"output": output, "valid_formats": list(self.OUTPUT_FORMATS)}
             )
         
         try:
@@ -128,13 +213,10 @@ class XORCipher(CipherInterface):
                 )
             
             # XOR operation
-            result_bytes = bytes([
-                data_bytes[i] ^ key_bytes[i % len(key_bytes)]
-                for i in range(len(data_bytes))
-            ])
+            result_bytes = self._xor_core(data_bytes, key_bytes)
             
             # Return hex string for string input, bytes for bytes input
-            if is_string_input:
+            if output == 'hex' or (output == 'auto' and is_string_input):
                 return result_bytes.hex()
             else:
                 return result_bytes
@@ -191,11 +273,12 @@ class XORCipher(CipherInterface):
                     details={"provided_type": type(data).__name__}
                 )
             
-            # XOR operation (same as encryption)
-            result = self.encrypt(data_bytes, key)
+            # XOR operation (same as encryption), without re-entering
+            # encrypt's type checks and exception wrapping
+            result = self._xor_core(data_bytes, _key_bytes(key))
             
             # Convert bytes result to string if input was hex string
-            if is_hex_string and isinstance(result, bytes):
+            if is_hex_string:
                 try:
                     return result.decode('utf-8')
                 except UnicodeDecodeError:
@@ -204,18 +287,185 @@ class XORCipher(CipherInterface):
             
             return result
         
-        except EncryptionError as e:
-            raise DecryptionError(
-                f"Failed to decrypt data: {e}",
-                details={"error": str(e), "key": key}
-            )
         except Exception as e:
             raise DecryptionError(
                 f"Failed to decrypt data: {e}",
                 details={"error": str(e), "key": key}
             )
     
-    def crack(self, data: Union[str, bytes]) -> dict[str, Any]:
+    def encrypt_stream(
+        self,
+        src: BinaryIO,
+        dst: BinaryIO,
+        key: Any,
+        chunk_size: int = CHUNK_SIZE
+    ) -> int:
+        """
+        XOR a binary stream into another, one chunk at a time.
+        
+        Only one chunk is held in memory, so arbitrarily large files can be
+        processed. The key position carries across chunks, so the output
+        equals encrypt() on the whole input. XOR is symmetric, so the same
+        call also decrypts.
+        
+        Args:
+            src: Readable binary stream (e.g. file opened with 'rb')
+            dst: Writable binary stream (e.g. file opened with 'wb')
+            key: Integer key (0-255), bytes key or str key
+            chunk_size: Bytes read per chunk (default 64KB); rounded down to
+                a multiple of the key length for multi-byte keys
+        
+        Returns:
+            Number of bytes written to dst
+        
+        Raises:
+            InvalidKeyError: If key is invalid
+            ValidationError: If chunk_size is not a positive integer or src
+                is not a binary stream
+            EncryptionError: If reading or writing fails
+        
+        Time Complexity: O(n) where n is stream length
+        Space Complexity: O(chunk_size)
+        
+        Examples:
+            >>> cipher = XORCipher()
+            >>> with open("in.bin", "rb") as src, open("out.bin", "wb") as dst:
+            ...     cipher.encrypt_stream(src, dst, key=b"secret")
+        """
+        key_bytes = _key_bytes(key)
+        
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValidationError(
+                f"chunk_size must be a positive integer, got {chunk_size!r}",
+                details={"chunk_size": chunk_size}
+            )
+        
+        key_length = len(key_bytes)
+        phase = 0
+        written = 0
+        
+        if key_length > 1:
+            # Whole-key-sized reads keep every full chunk at key phase 0, so
+            # its tiled key stream is built once and reused
+            chunk_size = max(key_length, chunk_size - chunk_size % key_length)
+            full_key_stream = self._key_stream(key_bytes, chunk_size)
+        
+        try:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                
+                # Only the first chunk needs checking: a text-mode source
+                # yields str throughout
+                if written == 0 and not isinstance(
+                    chunk, (bytes, bytearray, memoryview)
+                ):
+                    raise ValidationError(
+                        f"src must be a binary stream, read {type(chunk).__name__}",
+                        details={"chunk_type": type(chunk).__name__}
+                    )
+                
+                length = len(chunk)
+                if key_length > 1 and phase == 0 and length == chunk_size:
+                    result = (
+                        int.from_bytes(chunk, 'little') ^ full_key_stream
+                    ).to_bytes(length, 'little')
+                else:
+                    # Short read: start the key where the previous chunk left off
+                    rotated_key = key_bytes[phase:] + key_bytes[:phase]
+                    result = self._xor_core(chunk, rotated_key)
+                    phase = (phase + length) % key_length
+                
+                dst.write(result)
+                written += len(result)
+        
+        except OSError as e:
+            raise EncryptionError(
+                f"Failed to encrypt stream: {e}",
+                details={"error": str(e), "bytes_written": written}
+            )
+        
+        return written
+    
+    def encrypt_file(
+        self,
+        src_path: Union[str, Path],
+        dst_path: Union[str, Path],
+        key: Any,
+        chunk_size: int = CHUNK_SIZE
+    ) -> int:
+        """
+        XOR a file into another file by streaming it in chunks.
+        
+        Buffered 64KB reads are used rather than mmap: memory-mapping the
+        input measured no faster for this copy-and-XOR workload and is
+        unavailable for empty files.
+        
+        Args:
+            src_path: File to encrypt (or decrypt, XOR is symmetric)
+            dst_path: Output file, created or truncated
+            key: Integer key (0-255), bytes key or str key
+            chunk_size: Bytes read per chunk (default 64KB)
+        
+        Returns:
+            Number of bytes written
+        
+        Raises:
+            FileOperationError: If src_path is missing, dst_path is the same
+                file as src_path, or a file can't be opened
+            InvalidKeyError: If key is invalid
+            ValidationError: If chunk_size is not a positive integer
+            EncryptionError: If reading or writing fails
+        
+        Time Complexity: O(n) where n is file size
+        Space Complexity: O(chunk_size)
+        
+        Examples:
+            >>> cipher = XORCipher()
+            >>> cipher.encrypt_file("secret.bin", "secret.xor", key=b"k3y")
+        """
+        path = Path(src_path)
+        
+        if not path.is_file():
+            raise FileOperationError(
+                f"File not found: {src_path}",
+                details={"path": str(src_path)}
+            )
+        
+        # Opening dst with 'wb' would truncate the source before it is read
+        if os.path.exists(dst_path) and os.path.samefile(path, dst_path):
+            raise FileOperationError(
+                f"Source and destination are the same file: {src_path}",
+                details={"src_path": str(src_path), "dst_path": str(dst_path)}
+            )
+        
+        # Fail on a bad key before creating the output file
+        _key_bytes(key)
+        
+        try:
+            src = open(path, 'rb')
+        except OSError as e:
+            raise FileOperationError(
+                f"Cannot open file for reading: {src_path}",
+                details={"path": str(src_path), "error": str(e)}
+            ) from e
+        
+        with src:
+            try:
+                dst = open(dst_path, 'wb')
+            except OSError as e:
+                raise FileOperationError(
+                    f"Cannot open file for writing: {dst_path}",
+                    details={"path": str(dst_path), "error": str(e)}
+                ) from e
+            
+            with dst:
+                return self.encrypt_stream(src, dst, key, chunk_size)
+    
+    def crack(
+        self, data: Union[str, bytes, bytearray, memoryview]
+    ) -> dict[str, Any]:
         """
         Crack XOR cipher with single-byte key using brute force.
         
@@ -226,7 +476,7 @@ class XORCipher(CipherInterface):
         3. Presence of common English words
         
         Args:
-            data: Ciphertext (hex string or bytes) to crack
+            data: Ciphertext (hex string or bytes-like object) to crack
         
         Returns:
             Dictionary containing:
@@ -262,6 +512,9 @@ class XORCipher(CipherInterface):
                 )
         elif isinstance(data, bytes):
             data_bytes = data
+        elif isinstance(data, (bytearray, memoryview)):
+            # One flat copy so every candidate can use bytes.translate
+            data_bytes = bytes(data)
         else:
             raise ValidationError(
                 f"Data must be string or bytes, got {type(data).__name__}",
@@ -284,13 +537,50 @@ class XORCipher(CipherInterface):
         best_score = -1
         scores = {}
         
+        # Every candidate plaintext relabels the same bytes, so one histogram
+        # of the ciphertext gives the character classes for all 256 keys.
+        # A key yields pure ASCII iff it clears the high bit every
+        # ciphertext byte shares; only those keys use the histogram.
+        length = len(data_bytes)
+        histogram = list(Counter(data_bytes).items())
+        high_bits = {byte & 0x80 for byte, _ in histogram}
+        ascii_high_bit = high_bits.pop() if len(high_bits) == 1 else None
+        char_scores = self._ASCII_CHAR_SCORES
+        xor_tables = self._XOR_TABLES
+        
+        # The distinct ciphertext bytes also decide, per key, whether the
+        # candidate can possibly be UTF-8 without decoding it
+        distinct_bytes = bytes(byte for byte, _ in histogram)
+        utf8_classes = self._UTF8_BYTE_CLASSES
+        
         for key in range(256):
             try:
+                if key & 0x80 != ascii_high_bit:
+                    classes = distinct_bytes.translate(xor_tables[key]).translate(utf8_classes)
+                    if b'x' in classes or (b'c' in classes) != (b'l' in classes):
+                        # Forbidden byte, stray continuation or lone lead byte
+                        scores[key] = -1000
+                        continue
+                
                 # XOR with this key
-                decrypted_bytes = bytes([
-                    data_bytes[i] ^ key
-                    for i in range(len(data_bytes))
-                ])
+                decrypted_bytes = data_bytes.translate(xor_tables[key])
+                
+                if key & 0x80 == ascii_high_bit:
+                    decrypted_str = decrypted_bytes.decode('ascii')
+                    char_total = sum([
+                        count * char_scores[byte ^ key] for byte, count in histogram
+                    ])
+                    score = (
+                        char_total + self._count_common_words(decrypted_str) * 10
+                    ) / length * 100
+                    
+                    scores[key] = score
+                    
+                    if score > best_score:
+                        best_score = score
+                        best_key = key
+                        best_plaintext = decrypted_str
+                    continue
                 
                 # Try to decode as UTF-8
                 try:
@@ -329,6 +619,90 @@ class XORCipher(CipherInterface):
             'best_score': best_score
         }
     
+    def crack_batch(
+        self, items: Iterable[Union[str, bytes, bytearray, memoryview]]
+    ) -> list[dict[str, Any]]:
+        """
+        Crack many independent single-byte XOR ciphertexts.
+        
+        Each item is cracked on its own (every record may use a different
+        key); the class-level translate and scoring tables are shared.
+        
+        Args:
+            items: Ciphertexts (hex strings or bytes-like objects)
+        
+        Returns:
+            List of crack() result dictionaries, in input order
+        
+        Raises:
+            ValidationError: If any item is invalid
+        
+        Time Complexity: O(N) where N is total ciphertext length
+        
+        Examples:
+            >>> cipher = XORCipher()
+            >>> results = cipher.crack_batch([
+            ...     cipher.encrypt("meet me at the usual place", key=42),
+            ...     cipher.encrypt(b"the quick brown fox jumps", key=7),
+            ... ])
+            >>> [result['key'] for result in results]
+            [42, 7]
+        """
+        return [self.crack(item) for item in items]
+    
+    def _xor_core(self, data_bytes: bytes, key_bytes: bytes) -> bytes:
+        """
+        XOR data with a repeating key, with no validation or wrapping.
+        
+        Args:
+            data_bytes: Data to XOR
+            key_bytes: Normalized non-empty key (see _key_bytes)
+        
+        Returns:
+            XORed bytes, same length as data_bytes
+        
+        Time Complexity: O(n) where n is length of data
+        """
+        if len(key_bytes) == 1:
+            # Single-byte key: one C-level lookup pass over the buffer
+            return data_bytes.translate(self._XOR_TABLES[key_bytes[0]])
+        
+        # Tile the key to the data length, then XOR both buffers as single
+        # big integers in one C-level operation
+        return self._xor_repeating(data_bytes, key_bytes)
+    
+    def _xor_repeating(self, data_bytes: bytes, key_bytes: bytes) -> bytes:
+        """
+        XOR data with a cyclically repeated multi-byte key.
+        
+        Args:
+            data_bytes: Data to XOR
+            key_bytes: Non-empty key, repeated to the data length
+        
+        Returns:
+            XORed bytes, same length as data_bytes
+        
+        Time Complexity: O(n) where n is length of data
+        """
+        length = len(data_bytes)
+        return (
+            int.from_bytes(data_bytes, 'little') ^ self._key_stream(key_bytes, length)
+        ).to_bytes(length, 'little')
+    
+    def _key_stream(self, key_bytes: bytes, length: int) -> int:
+        """
+        Tile a key to length bytes, packed as a little-endian integer.
+        
+        Args:
+            key_bytes: Non-empty key
+            length: Number of key stream bytes
+        
+        Returns:
+            Integer form of the repeated key, ready to XOR
+        """
+        repeats = -(-length // len(key_bytes))
+        return int.from_bytes((key_bytes * repeats)[:length], 'little')
+    
     def _score_plaintext(self, text: str) -> float:
         """
         Score plaintext based on English language characteristics.
@@ -352,15 +726,23 @@ class XORCipher(CipherInterface):
         
         score = 0.0
         
-        # Check printable characters
-        for char in text:
-            if char.isprintable() or char in '\n\r\t':
-                score += 1
-            else:
-                score -= 5  # Penalize non-printable
+        if text.isascii():
+            # Count classes with C-level deletes instead of per-char calls
+            raw = text.encode('ascii')
+            printable_count = len(raw.translate(None, self._ASCII_NON_PRINTABLE))
+            score += printable_count - 5 * (len(raw) - printable_count)
+            alpha_count = len(raw.translate(None, self._ASCII_NON_ALPHA))
+        else:
+            # Same classes via C-level maps; \n, \r and \t are not
+            # isprintable() but count as printable here
+            printable_count = (
+                sum(map(str.isprintable, text))
+                + text.count('\n') + text.count('\r') + text.count('\t')
+            )
+            score += printable_count - 5 * (len(text) - printable_count)
+            alpha_count = sum(map(str.isalpha, text))
         
         # Check for alphabetic characters
-        alpha_count = sum(1 for c in text if c.isalpha())
         score += alpha_count * 2
         
         # Check for spaces (indicates word boundaries)
@@ -368,9 +750,7 @@ class XORCipher(CipherInterface):
         score += space_count
         
         # Check for common English words
-        words = text.lower().split()
-        common_word_count = sum(1 for word in words if word in self.COMMON_WORDS)
-        score += common_word_count * 10
+        score += self._count_common_words(text) * 10
         
         # Normalize by length
         if len(text) > 0:
@@ -378,6 +758,19 @@ class XORCipher(CipherInterface):
         
         return score
     
+    def _count_common_words(self, text: str) -> int:
+        """
+        Count whitespace-separated words of text found in COMMON_WORDS.
+        
+        Args:
+            text: Plaintext to scan (any case)
+        
+        Returns:
+            Number of common English words
+        """
+        # C-level membership map; a word-boundary regex measured ~3x slower
+        return sum(map(self.COMMON_WORDS.__contains__, text.lower().split()))
+    
     def __repr__(self) -> str:
         """Return string representation."""
         return "XORCipher()"
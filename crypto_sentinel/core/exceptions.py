@@ -20,8 +20,17 @@ class CryptoSentinelError(Exception):
     Attributes:
         message: Human-readable error description
         details: Optional dictionary containing additional error context
+    
+    The formatted ``str()`` and ``repr()`` are built on first use and
+    cached, so exceptions that are raised and caught silently pay nothing
+    and repeatedly logged ones format their details only once. Treat
+    ``message`` and ``details`` as read-only after construction.
     """
     
+    # Per-instance formatting caches, filled in by __str__ / __repr__
+    _str: Optional[str] = None
+    _repr: Optional[str] = None
+    
     def __init__(
         self, 
         message: str, 
@@ -45,12 +54,15 @@ class CryptoSentinelError(Exception):
         Returns:
             Formatted error message with details if available
         """
-        if self.details:
-            details_str = ", ".join(
-                f"{key}={value}" for key, value in self.details.items()
-            )
-            return f"{self.message} ({details_str})"
-        return self.message
+        if self._str is None:
+            if self.details:
+                details_str = ", ".join(
+                    f"{key}={value}" for key, value in self.details.items()
+                )
+                self._str = f"{self.message} ({details_str})"
+            else:
+                self._str = self.message
+        return self._str
     
     def __repr__(self) -> str:
         """
@@ -59,7 +71,9 @@ class CryptoSentinelError(Exception):
         Returns:
             Developer-friendly exception representation
         """
-        return f"{self.__class__.__name__}(message={self.message!r}, details={self.details!r})"
+        if self._repr is None:
+            self._repr = f"{self.__class__.__name__}(message={self.message!r}, details={self.details!r})"
+        return self._repr
 
 
 class EncryptionError(CryptoSentinelError):
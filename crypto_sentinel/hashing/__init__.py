@@ -1,16 +1,53 @@
 """
 Hashing algorithms module.
 
-Includes implementations for MD5, SHA256, and checksum algorithms.
+Includes implementations for MD5, SHA256, optional BLAKE3, and checksum
+algorithms.
+
+Hasher classes are imported lazily (PEP 562) so that importing the package
+does not pay for modules the caller never uses.
 
 Developer: saisrujanmurthy@gmail.com
 """
 
-from crypto_sentinel.hashing.hash_engine import MD5Hasher, SHA256Hasher
-from crypto_sentinel.hashing.checksum_validator import ChecksumValidator
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .hash_engine import HAS_BLAKE3, Blake3Hasher, MD5Hasher, SHA256Hasher
+    from .checksum_validator import ChecksumValidator
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "MD5Hasher": "hash_engine",
+    "SHA256Hasher": "hash_engine",
+    "Blake3Hasher": "hash_engine",
+    "HAS_BLAKE3": "hash_engine",
+    "ChecksumValidator": "checksum_validator",
+}
 
 __all__ = [
     'MD5Hasher',
     'SHA256Hasher',
+    'Blake3Hasher',
+    'HAS_BLAKE3',
     'ChecksumValidator',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a hashing class on first access and cache it in the module."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = importlib.import_module(f".{module_name}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
@@ -7,11 +7,68 @@ supporting both file-to-file and file-to-hash-string comparisons.
 Developer: saisrujanmurthy@gmail.com
 """
 
+import hashlib
+import hmac
+import os
+import stat
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from crypto_sentinel.hashing.hash_engine import MD5Hasher, SHA256Hasher
-from crypto_sentinel.core.exceptions import FileOperationError, ValidationError
+from crypto_sentinel.core.base_hasher import HasherInterface
+from crypto_sentinel.hashing.hash_engine import (
+    HAS_BLAKE3,
+    Blake3Hasher,
+    MD5Hasher,
+    SHA256Hasher,
+    _new_hash,
+    _stat_file,
+)
+from crypto_sentinel.core.exceptions import (
+    FileOperationError,
+    HashingError,
+    ValidationError,
+)
+
+
+class _LazyHashers(Mapping[str, HasherInterface]):
+    """
+    Read-only algorithm -> hasher mapping that builds hashers on first use.
+    
+    Membership, iteration and ``len`` only consult the registered
+    factories, so listing or validating algorithm names never constructs
+    a hasher.
+    """
+    
+    def __init__(
+        self,
+        factories: dict[str, Callable[[], HasherInterface]]
+    ) -> None:
+        """Store the factories; no hasher is constructed yet."""
+        self._factories = factories
+        self._instances: dict[str, HasherInterface] = {}
+    
+    def __getitem__(self, algorithm: str) -> HasherInterface:
+        """Return the hasher for an algorithm, constructing it once."""
+        hasher = self._instances.get(algorithm)
+        if hasher is None:
+            hasher = self._factories[algorithm]()
+            self._instances[algorithm] = hasher
+        return hasher
+    
+    def __contains__(self, algorithm: object) -> bool:
+        """Check registration without constructing the hasher."""
+        return algorithm in self._factories
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over registered algorithm names."""
+        return iter(self._factories)
+    
+    def __len__(self) -> int:
+        """Return the number of registered algorithms."""
+        return len(self._factories)
 
 
 class ChecksumValidator:
@@ -33,6 +90,8 @@ class ChecksumValidator:
     Supported Algorithms:
         - MD5: Fast but not cryptographically secure
         - SHA256: Secure and recommended for integrity verification
+        - BLAKE3: Multithreaded and much faster on large files
+          (only when the optional ``blake3`` package is installed)
     
     Example:
         >>> validator = ChecksumValidator()
@@ -47,20 +106,39 @@ class ChecksumValidator:
         ...     algorithm="sha256"
         ... )
         >>> print(result['match'])  # True if hash matches
+    
+    Caching:
+        Digests are memoized per validator, keyed by the file's device,
+        inode, modification and change times (ns), size and algorithm.
+        Reports and comparisons of an unchanged file cost one ``stat`` call;
+        any write forces a re-hash. ``validate_file`` never trusts the cache,
+        since it is used for tamper detection. Call ``clear_cache()`` to drop
+        all entries.
     """
     
+    CACHE_SIZE: int = 256  # Maximum memoized digests per validator
+    
     def __init__(self) -> None:
-        """Initialize checksum validator with supported hashers."""
-        self.hashers = {
-            'md5': MD5Hasher(),
-            'sha256': SHA256Hasher(),
+        """Initialize checksum validator; hashers are built on first use."""
+        factories: dict[str, Callable[[], HasherInterface]] = {
+            'md5': MD5Hasher,
+            'sha256': SHA256Hasher,
         }
+        if HAS_BLAKE3:
+            factories['blake3'] = Blake3Hasher
+        self.hashers: Mapping[str, HasherInterface] = _LazyHashers(factories)
+        self._cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+    
+    def clear_cache(self) -> None:
+        """Drop every memoized file digest."""
+        self._cache.clear()
     
     def compare_files(
         self,
         filepath1: str,
         filepath2: str,
-        algorithm: str = "sha256"
+        algorithm: str = "sha256",
+        fast: bool = False
     ) -> dict[str, Any]:
         """
         Compare two files by computing and comparing their hashes.
@@ -68,17 +146,29 @@ class ChecksumValidator:
         This method computes the hash of both files independently and
         compares them. Files are considered identical if their hashes match.
         
+        Files whose sizes differ cannot match, so they are reported as a
+        mismatch without hashing either one. Files larger than one hasher
+        chunk are hashed concurrently on two threads (hashlib releases the
+        GIL), letting the two reads overlap.
+        
+        With ``fast=True`` no digests are computed: equal-sized regular files
+        are compared chunk by chunk and the comparison stops at the first
+        differing chunk. Use it when only ``match`` is needed.
+        
         Args:
             filepath1: Path to first file
             filepath2: Path to second file
             algorithm: Hash algorithm to use ('md5' or 'sha256')
+            fast: Compare raw bytes instead of hashes (hash1/hash2 are None)
             
         Returns:
             Dictionary containing:
                 - match (bool): True if files are identical
                 - algorithm (str): Algorithm used
-                - hash1 (str): Hash of first file
-                - hash2 (str): Hash of second file
+                - hash1 (str | None): Hash of first file (None if sizes
+                  differ or fast is set)
+                - hash2 (str | None): Hash of second file (None if sizes
+                  differ or fast is set)
                 - file1 (str): First file path
                 - file2 (str): Second file path
                 
@@ -110,9 +200,54 @@ class ChecksumValidator:
         
         hasher = self.hashers[algorithm]
         
-        # Compute hashes
-        hash1 = hasher.hash_file(filepath1)
-        hash2 = hasher.hash_file(filepath2)
+        # Stat both up front so a missing or non-regular file fails before
+        # any hashing starts
+        info1 = _stat_file(filepath1)
+        info2 = _stat_file(filepath2)
+        
+        if info1.st_size != info2.st_size:
+            # Different sizes can never hash equal
+            return {
+                'match': False,
+                'algorithm': algorithm,
+                'hash1': None,
+                'hash2': None,
+                'file1': filepath1,
+                'file2': filepath2,
+            }
+        
+        if fast:
+            return {
+                'match': self._same_content(
+                    filepath1, filepath2, info1, info2, hasher.chunk_size
+                ),
+                'algorithm': algorithm,
+                'hash1': None,
+                'hash2': None,
+                'file1': filepath1,
+                'file2': filepath2,
+            }
+        
+        key1 = self._cache_key(info1, algorithm)
+        key2 = self._cache_key(info2, algorithm)
+        hash1 = self._cache_get(key1)
+        hash2 = self._cache_get(key2)
+        
+        # Compute missing hashes, overlapping the reads for large files
+        if hash1 is None and hash2 is None and info1.st_size > hasher.chunk_size:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future1 = executor.submit(hasher.hash_file, filepath1)
+                future2 = executor.submit(hasher.hash_file, filepath2)
+                hash1 = future1.result()
+                hash2 = future2.result()
+        else:
+            if hash1 is None:
+                hash1 = hasher.hash_file(filepath1)
+            if hash2 is None:
+                hash2 = hasher.hash_file(filepath2)
+        
+        self._cache_put(key1, hash1)
+        self._cache_put(key2, hash2)
         
         # Compare
         match = hash1 == hash2
@@ -138,6 +273,10 @@ class ChecksumValidator:
         This is commonly used to verify downloaded files against
         checksums provided by the distributor.
         
+        As the tamper-detection entry point, this always re-hashes the file
+        rather than trusting a memoized digest; the fresh digest is still
+        stored for later reports and comparisons.
+        
         Args:
             filepath: Path to file to validate
             expected_hash: Expected hash value (hexadecimal string)
@@ -181,7 +320,7 @@ class ChecksumValidator:
         
         # Validate hash format
         expected_hash = expected_hash.lower().strip()
-        expected_length = 32 if algorithm == 'md5' else 64
+        expected_length = self.hashers[algorithm].digest_size * 2
         
         if len(expected_hash) != expected_length:
             raise ValidationError(
@@ -189,18 +328,33 @@ class ChecksumValidator:
                 f"expected {expected_length}, got {len(expected_hash)}"
             )
         
-        if not all(c in '0123456789abcdef' for c in expected_hash):
+        # Decode and validate in one C-level pass; fromhex tolerates
+        # embedded spaces, which the decoded length check rejects
+        try:
+            expected_bytes = bytes.fromhex(expected_hash)
+        except ValueError as e:
+            raise ValidationError(
+                f"Invalid hash format: must be hexadecimal string"
+            ) from e
+        
+        if len(expected_bytes) * 2 != expected_length:
             raise ValidationError(
                 f"Invalid hash format: must be hexadecimal string"
             )
         
         hasher = self.hashers[algorithm]
         
-        # Compute actual hash
+        # Always compute the actual hash: stat metadata can be forged
+        key = self._cache_key(self._stat_regular(filepath), algorithm)
         computed_hash = hasher.hash_file(filepath)
+        self._cache_put(key, computed_hash)
         
-        # Compare
-        match = computed_hash == expected_hash
+        # Constant-time compare of the raw digests, so the validator is
+        # safe to use where timing side channels matter
+        match = hmac.compare_digest(
+            bytes.fromhex(computed_hash),
+            expected_bytes
+        )
         
         return {
             'match': match,
@@ -210,6 +364,82 @@ class ChecksumValidator:
             'file': filepath,
         }
     
+    def hash_many(
+        self,
+        filepaths: Iterable[str],
+        algorithm: str = "sha256",
+        workers: int | None = None
+    ) -> dict[str, str]:
+        """
+        Hash many files concurrently on a bounded thread pool.
+        
+        Each task owns its own hash object and hashlib releases the GIL
+        while hashing, so several reads can be in flight at once and keep
+        the disk queue busy. Digests already memoized for unchanged files
+        are reused without touching the pool.
+        
+        Args:
+            filepaths: Paths of files to hash
+            algorithm: Hash algorithm to use ('md5' or 'sha256')
+            workers: Maximum concurrent hashes (default: 2 per CPU, max 32);
+                1 hashes serially on the calling thread
+                
+        Returns:
+            Dictionary mapping each path to its hexadecimal digest, in
+            input order (duplicate paths appear once)
+            
+        Raises:
+            ValidationError: If algorithm or workers is invalid
+            FileOperationError: If any file doesn't exist or can't be read
+            
+        Time Complexity: O(total bytes / workers) when I/O bound
+        
+        Example:
+            >>> validator = ChecksumValidator()
+            >>> digests = validator.hash_many(["a.iso", "b.iso", "c.iso"])
+            >>> for path, digest in digests.items():
+            ...     print(f"{digest}  {path}")
+        """
+        algorithm = algorithm.lower()
+        
+        if algorithm not in self.hashers:
+            raise ValidationError(
+                f"Unsupported algorithm: {algorithm}. "
+                f"Supported: {list(self.hashers.keys())}"
+            )
+        
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 2)
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            raise ValidationError(
+                "workers must be a positive integer",
+                details={'workers': workers}
+            )
+        
+        hasher = self.hashers[algorithm]
+        paths = list(dict.fromkeys(filepaths))
+        keys = {
+            path: self._cache_key(self._stat_regular(path), algorithm)
+            for path in paths
+        }
+        digests = {path: self._cache_get(keys[path]) for path in paths}
+        pending = [path for path in paths if digests[path] is None]
+        
+        if workers == 1 or len(pending) <= 1:
+            computed = map(hasher.hash_file, pending)
+            for path, digest in zip(pending, computed):
+                digests[path] = digest
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                computed = executor.map(hasher.hash_file, pending)
+                for path, digest in zip(pending, computed):
+                    digests[path] = digest
+        
+        for path in pending:
+            self._cache_put(keys[path], digests[path])
+        
+        return digests
+    
     def generate_report(
         self,
         filepath: str,
@@ -219,7 +449,9 @@ class ChecksumValidator:
         Generate comprehensive hash report for a file.
         
         Computes multiple hash values for a single file, useful for
-        creating verification files or detailed integrity reports.
+        creating verification files or detailed integrity reports. The
+        file is read once and every chunk is fed to all requested hashes,
+        so disk traffic does not grow with the number of algorithms.
         
         Args:
             filepath: Path to file to analyze
@@ -242,31 +474,47 @@ class ChecksumValidator:
             >>> print(f"SHA256: {report['hashes']['sha256']}")
             >>> print(f"Size:   {report['size']} bytes")
         """
-        path = Path(filepath)
+        # Normalize (once per name, dropping duplicates) and validate
+        # before touching the file system
+        if algorithms is None:
+            names = list(self.hashers.keys())
+        else:
+            names = list(dict.fromkeys(algo.lower() for algo in algorithms))
         
-        if not path.exists():
+        unknown = [algo for algo in names if algo not in self.hashers]
+        if unknown:
+            raise ValidationError(
+                f"Unsupported algorithm: {', '.join(unknown)}. "
+                f"Supported: {list(self.hashers.keys())}"
+            )
+        
+        info = self._stat_regular(filepath)
+        
+        # Path('') resolves to the current directory, so an empty path
+        # falls through to "Path is not a file" as it always has
+        if info is None and not Path(filepath).exists():
             raise FileOperationError(f"File not found: {filepath}")
         
-        if algorithms is None:
-            algorithms = list(self.hashers.keys())
-        
-        # Validate algorithms
-        for algo in algorithms:
-            if algo.lower() not in self.hashers:
-                raise ValidationError(
-                    f"Unsupported algorithm: {algo}. "
-                    f"Supported: {list(self.hashers.keys())}"
-                )
+        # Reuse memoized digests, then compute hashlib ones in one pass;
+        # other backends (BLAKE3) hash the file with their own threads
+        keys = {algo: self._cache_key(info, algo) for algo in names}
+        hashes = {algo: self._cache_get(keys[algo]) for algo in names}
+        missing = [algo for algo in names if hashes[algo] is None]
+        streamed = [
+            algo for algo in missing
+            if self.hashers[algo].algorithm in hashlib.algorithms_available
+        ]
         
-        # Compute hashes
-        hashes = {}
-        for algo in algorithms:
-            algo = algo.lower()
-            hasher = self.hashers[algo]
-            hashes[algo] = hasher.hash_file(filepath)
+        if streamed or info is None:
+            size, computed = self._digest_once(filepath, streamed)
+        else:
+            size, computed = info.st_size, {}
         
-        # Get file size
-        size = path.stat().st_size
+        for algo in missing:
+            if algo not in computed:
+                computed[algo] = self.hashers[algo].hash_file(filepath)
+            hashes[algo] = computed[algo]
+            self._cache_put(keys[algo], computed[algo])
         
         return {
             'file': filepath,
@@ -274,6 +522,214 @@ class ChecksumValidator:
             'hashes': hashes,
         }
     
+    def _digest_once(
+        self,
+        filepath: str,
+        algorithms: list[str]
+    ) -> tuple[int, dict[str, str]]:
+        """
+        Hash a file with several algorithms from a single read pass.
+        
+        Each chunk is read once into a reusable buffer and passed to every
+        hash object. With more than one algorithm on a multi-core machine,
+        the per-chunk updates run on a thread pool (hashlib releases the
+        GIL), so the slower algorithm no longer serializes the others.
+        
+        Args:
+            filepath: Path to file to hash
+            algorithms: Validated, lowercase algorithm names
+            
+        Returns:
+            Tuple of (file size in bytes, {algorithm: hex digest})
+            
+        Raises:
+            FileOperationError: If path is not a file or can't be read
+            HashingError: If hashing operation fails
+        """
+        path = Path(filepath)
+        
+        if not path.is_file():
+            raise FileOperationError(f"Path is not a file: {filepath}")
+        
+        hash_objs = [
+            _new_hash(self.hashers[algo].algorithm) for algo in algorithms
+        ]
+        chunk_size = max(
+            (self.hashers[algo].chunk_size for algo in algorithms),
+            default=1
+        )
+        
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                parallel = (
+                    len(hash_objs) > 1
+                    and size > chunk_size
+                    and (os.cpu_count() or 1) > 1
+                )
+                executor = (
+                    ThreadPoolExecutor(max_workers=len(hash_objs))
+                    if parallel else None
+                )
+                
+                try:
+                    with memoryview(bytearray(chunk_size)) as buffer:
+                        while hash_objs:
+                            count = f.readinto(buffer)
+                            if not count:
+                                break
+                            piece = buffer[:count]
+                            if executor is None:
+                                for hash_obj in hash_objs:
+                                    hash_obj.update(piece)
+                            else:
+                                list(executor.map(
+                                    lambda hash_obj: hash_obj.update(piece),
+                                    hash_objs
+                                ))
+                            piece.release()
+                finally:
+                    if executor is not None:
+                        executor.shutdown()
+                        
+        except PermissionError as e:
+            raise FileOperationError(
+                f"Permission denied reading file: {filepath}"
+            ) from e
+        except OSError as e:
+            raise HashingError(
+                f"File hashing failed: {str(e)}"
+            ) from e
+        
+        hashes = {
+            algo: hash_obj.hexdigest()
+            for algo, hash_obj in zip(algorithms, hash_objs)
+        }
+        return size, hashes
+    
+    @staticmethod
+    def _same_content(
+        filepath1: str,
+        filepath2: str,
+        info1: os.stat_result,
+        info2: os.stat_result,
+        chunk_size: int
+    ) -> bool:
+        """
+        Compare two equal-sized regular files byte for byte.
+        
+        Args:
+            filepath1: Path to first file
+            filepath2: Path to second file
+            info1: Stat result of the first file
+            info2: Stat result of the second file
+            chunk_size: Bytes to read from each file per step
+            
+        Returns:
+            True if both files hold identical bytes
+            
+        Raises:
+            FileOperationError: If either file can't be read
+        """
+        if (info1.st_dev, info1.st_ino) == (info2.st_dev, info2.st_ino):
+            return True
+        
+        # Raw reads may return short, so each buffer is filled completely
+        # before the two are compared
+        buffer1 = bytearray(chunk_size)
+        buffer2 = bytearray(chunk_size)
+        
+        try:
+            with open(filepath1, 'rb', buffering=0) as f1:
+                with open(filepath2, 'rb', buffering=0) as f2:
+                    while True:
+                        count1 = ChecksumValidator._read_full(f1, buffer1)
+                        count2 = ChecksumValidator._read_full(f2, buffer2)
+                        if count1 != count2:
+                            return False
+                        if count1 < chunk_size:
+                            return buffer1[:count1] == buffer2[:count2]
+                        if buffer1 != buffer2:
+                            return False
+        except OSError as e:
+            raise FileOperationError(
+                f"Failed reading files for comparison: {str(e)}",
+                details={'file1': filepath1, 'file2': filepath2}
+            ) from e
+    
+    @staticmethod
+    def _read_full(f: BinaryIO, buffer: bytearray) -> int:
+        """
+        Fill a buffer from a raw file, retrying short reads until EOF.
+        
+        Args:
+            f: File object opened in unbuffered binary mode
+            buffer: Buffer to fill
+            
+        Returns:
+            Number of bytes read (less than len(buffer) only at EOF)
+        """
+        filled = 0
+        with memoryview(buffer) as view:
+            while filled < len(buffer):
+                count = f.readinto(view[filled:])
+                if not count:
+                    break
+                filled += count
+        return filled
+    
+    @staticmethod
+    def _stat_regular(filepath: str) -> os.stat_result | None:
+        """
+        Stat a regular file, returning None if it cannot be stat'ed.
+        
+        Args:
+            filepath: Path to inspect
+            
+        Returns:
+            The stat result, or None for missing paths and non-regular files
+        """
+        try:
+            info = os.stat(filepath)
+        except (OSError, ValueError):
+            return None
+        return info if stat.S_ISREG(info.st_mode) else None
+    
+    @staticmethod
+    def _cache_key(
+        info: os.stat_result | None,
+        algorithm: str
+    ) -> tuple[Any, ...] | None:
+        """Build the digest cache key for a stat result, if there is one."""
+        if info is None:
+            return None
+        return (
+            info.st_dev,
+            info.st_ino,
+            info.st_mtime_ns,
+            info.st_ctime_ns,
+            info.st_size,
+            algorithm,
+        )
+    
+    def _cache_get(self, key: tuple[Any, ...] | None) -> str | None:
+        """Return a memoized digest and mark it most recently used."""
+        if key is None:
+            return None
+        digest = self._cache.get(key)
+        if digest is not None:
+            self._cache.move_to_end(key)
+        return digest
+    
+    def _cache_put(self, key: tuple[Any, ...] | None, digest: str) -> None:
+        """Memoize a digest, evicting the least recently used entry."""
+        if key is None:
+            return
+        self._cache[key] = digest
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
     def __repr__(self) -> str:
         """String representation of validator."""
         return f"ChecksumValidator(algorithms={list(self.hashers.keys())})"
@@ -8,8 +8,16 @@ Developer: saisrujanmurthy@gmail.com
 """
 
 import hashlib
+import mmap
+import os
+import stat
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+try:
+    import blake3
+except ImportError:  # Optional dependency: pip install crypto-sentinel[blake3]
+    blake3 = None
 
 from crypto_sentinel.core.base_hasher import HasherInterface
 from crypto_sentinel.core.exceptions import (
@@ -19,6 +27,211 @@ from crypto_sentinel.core.exceptions import (
 )
 
 
+# Whether the optional BLAKE3 backend is installed
+HAS_BLAKE3 = blake3 is not None
+
+# Files at least this large are hashed straight from a read-only mapping
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# After hashing files this large, their pages are dropped from the page
+# cache so a one-off integrity check does not evict the hot working set
+_CACHE_DROP_THRESHOLD = 1024 * 1024 * 1024
+
+
+def _new_hash(algorithm: str, data: bytes = b'') -> Any:
+    """
+    Create a hashlib hash object for one of the engine's algorithms.
+    
+    MD5 is flagged ``usedforsecurity=False`` (as in ``MD5Hasher.hash_string``)
+    so checksum use keeps working on FIPS-restricted builds.
+    
+    Args:
+        algorithm: hashlib algorithm name ('md5', 'sha256', ...)
+        data: Initial data to hash
+        
+    Returns:
+        The new hashlib hash object
+    """
+    if algorithm == 'md5':
+        return hashlib.new(algorithm, data, usedforsecurity=False)
+    return hashlib.new(algorithm, data)
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """
+    Pass a ``posix_fadvise`` hint for the whole file, where supported.
+    
+    Args:
+        fd: Open file descriptor
+        advice: Suffix of the ``os.POSIX_FADV_*`` constant ('SEQUENTIAL', ...)
+    """
+    value = getattr(os, f'POSIX_FADV_{advice}', None)
+    if value is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, value)
+    except OSError:
+        # Hints are best effort; some filesystems reject them
+        pass
+
+
+def _digest_mapped(
+    f: BinaryIO,
+    algorithm: str,
+    chunk_size: int,
+    size: int
+) -> Any | None:
+    """
+    Hash a file through a read-only memory mapping.
+    
+    The hash object reads the page cache directly, so no per-chunk bytes
+    objects are allocated. The mapping is fed to the hash in ``chunk_size``
+    slices. The kernel is hinted for sequential readahead where ``madvise``
+    is available.
+    
+    Warning:
+        If another process truncates the file while it is mapped, touching
+        the missing pages raises SIGBUS, which kills the interpreter rather
+        than raising an exception. The size is re-checked just before
+        mapping and only ``size`` bytes are mapped, but that cannot close
+        the window entirely; callers expecting concurrent truncation should
+        keep files under ``_MMAP_THRESHOLD`` or use streamed reads.
+    
+    Args:
+        f: File object opened in binary read mode
+        algorithm: hashlib algorithm name
+        chunk_size: Bytes per update call
+        size: File size in bytes, from the caller's stat
+        
+    Returns:
+        The populated hash object, or None if the file cannot be mapped
+        (the caller then falls back to streamed reads)
+    """
+    fd = f.fileno()
+    try:
+        # Skip mapping a file that is already changing size under us
+        if os.fstat(fd).st_size != size:
+            return None
+        mapping = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    
+    with mapping:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        
+        hash_obj = _new_hash(algorithm)
+        with memoryview(mapping) as view:
+            for start in range(0, len(view), chunk_size):
+                hash_obj.update(view[start:start + chunk_size])
+    return hash_obj
+
+
+def _stat_file(filepath: str | Path) -> os.stat_result:
+    """
+    Stat a path once and require it to be a regular file.
+    
+    Args:
+        filepath: Path to the file to hash
+        
+    Returns:
+        The stat result for the file
+        
+    Raises:
+        FileOperationError: If the path is missing, unreadable or not a file
+    """
+    try:
+        info = os.stat(filepath)
+    except PermissionError as e:
+        raise FileOperationError(
+            f"Permission denied reading file: {filepath}"
+        ) from e
+    except (OSError, ValueError) as e:
+        raise FileOperationError(
+            f"File not found: {filepath}"
+        ) from e
+    
+    if not stat.S_ISREG(info.st_mode):
+        raise FileOperationError(
+            f"Path is not a file: {filepath}"
+        )
+    return info
+
+
+def _digest_file(
+    f: BinaryIO,
+    algorithm: str,
+    chunk_size: int,
+    size: int
+) -> Any:
+    """
+    Feed an open binary file through a new hash object.
+    
+    Files no larger than ``chunk_size`` are hashed from a single read.
+    Larger files are streamed (see ``_digest_stream``) with the kernel told
+    to expect sequential access; files of 1GB or more are then dropped
+    from the page cache.
+    
+    Args:
+        f: File object opened in binary read mode
+        algorithm: hashlib algorithm name ('md5', 'sha256', ...)
+        chunk_size: Single-read threshold and streaming read size
+        size: File size in bytes, from the caller's stat
+        
+    Returns:
+        The populated hashlib hash object
+    """
+    if size <= chunk_size:
+        return _new_hash(algorithm, f.read())
+    
+    fd = f.fileno()
+    _fadvise(fd, 'SEQUENTIAL')
+    hash_obj = _digest_stream(f, algorithm, chunk_size, size)
+    if size >= _CACHE_DROP_THRESHOLD:
+        _fadvise(fd, 'DONTNEED')
+    return hash_obj
+
+
+def _digest_stream(
+    f: BinaryIO,
+    algorithm: str,
+    chunk_size: int,
+    size: int
+) -> Any:
+    """
+    Stream a file larger than one chunk through a new hash object.
+    
+    Files of 16MB or more are hashed from a memory mapping (see
+    ``_digest_mapped`` for the truncation caveat). Everything else
+    (or anything that cannot be mapped) is read ``chunk_size`` bytes at a
+    time into one reusable buffer. ``hashlib.file_digest`` is not used: its
+    buffer size is fixed, so it would ignore ``chunk_size``.
+    
+    Args:
+        f: File object opened in binary read mode
+        algorithm: hashlib algorithm name ('md5', 'sha256', ...)
+        chunk_size: Bytes per read or per mapped slice
+        size: File size in bytes
+        
+    Returns:
+        The populated hashlib hash object
+    """
+    if size >= _MMAP_THRESHOLD:
+        hash_obj = _digest_mapped(f, algorithm, chunk_size, size)
+        if hash_obj is not None:
+            return hash_obj
+    
+    # Read into one reusable buffer instead of allocating bytes per chunk
+    hash_obj = _new_hash(algorithm)
+    with memoryview(bytearray(chunk_size)) as buffer:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            hash_obj.update(buffer[:count])
+    return hash_obj
+
+
 class MD5Hasher(HasherInterface):
     """
     MD5 hash generator for strings and files.
@@ -30,7 +243,7 @@ class MD5Hasher(HasherInterface):
         purposes. Use it only for checksums and non-security applications.
     
     Features:
-        - Streaming file reading (64KB chunks) for large files
+        - Streaming file reading (1MB chunks, tunable) for large files
         - Graceful error handling for missing files
         - Supports both string and file hashing
     
@@ -48,10 +261,28 @@ class MD5Hasher(HasherInterface):
         >>> file_hash = hasher.hash_file("large_file.bin")
     """
     
-    CHUNK_SIZE: int = 65536  # 64KB chunks for streaming
+    CHUNK_SIZE: int = 1 << 20  # 1MB chunks for streaming
     
-    def __init__(self) -> None:
-        """Initialize MD5 hasher."""
+    def __init__(self, chunk_size: int | None = None) -> None:
+        """
+        Initialize MD5 hasher.
+        
+        Args:
+            chunk_size: Bytes per read (or per mapped slice) when
+                streaming files; files up to this size are hashed from a
+                single read (default: CHUNK_SIZE)
+                
+        Raises:
+            ValidationError: If chunk_size is not a positive integer
+        """
+        if chunk_size is None:
+            chunk_size = self.CHUNK_SIZE
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValidationError(
+                "chunk_size must be a positive integer",
+                details={'chunk_size': chunk_size}
+            )
+        self.chunk_size = chunk_size
         self.algorithm = "md5"
     
     @property
@@ -86,27 +317,29 @@ class MD5Hasher(HasherInterface):
             )
         
         try:
-            hash_obj = hashlib.md5()
-            hash_obj.update(data.encode('utf-8'))
-            return hash_obj.hexdigest()
-        except Exception as e:
+            encoded = data.encode('utf-8')
+        except UnicodeEncodeError as e:
             raise HashingError(
                 f"MD5 hashing failed: {str(e)}"
             ) from e
+        
+        # Checksum use only: usedforsecurity=False keeps MD5 available
+        # under FIPS-mode OpenSSL builds
+        return hashlib.md5(encoded, usedforsecurity=False).hexdigest()
     
     def hash_file(self, filepath: str) -> str:
         """
         Generate MD5 hash of a file using streaming reads.
         
-        This method reads the file in 64KB chunks to prevent memory
+        This method reads the file in fixed-size chunks to prevent memory
         exhaustion on large files (10GB+). The entire file is never
         loaded into memory at once.
         
         Implementation:
-            1. Open file in binary read mode
-            2. Read 64KB chunks in a loop
-            3. Update hash incrementally
-            4. Return final hexadecimal digest
+            1. Open file in unbuffered binary read mode
+            2. Stream it in chunk_size reads into one reusable buffer
+               (or chunk_size slices of a mapping for files of 16MB+)
+            3. Return final hexadecimal digest
         
         Args:
             filepath: Path to file to hash
@@ -119,34 +352,20 @@ class MD5Hasher(HasherInterface):
             HashingError: If hashing operation fails
             
         Time Complexity: O(n) where n is file size
-        Space Complexity: O(1) - only 64KB buffer in memory
+        Space Complexity: O(1) - at most one chunk buffer in memory
         
         Example:
             >>> hasher = MD5Hasher()
             >>> # Works efficiently even on 10GB files
             >>> hash_value = hasher.hash_file("/path/to/large_file.bin")
         """
-        path = Path(filepath)
-        
-        if not path.exists():
-            raise FileOperationError(
-                f"File not found: {filepath}"
-            )
-        
-        if not path.is_file():
-            raise FileOperationError(
-                f"Path is not a file: {filepath}"
-            )
+        info = _stat_file(filepath)
         
         try:
-            hash_obj = hashlib.md5()
-            
-            with open(path, 'rb') as f:
-                while True:
-                    chunk = f.read(self.CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    hash_obj.update(chunk)
+            with open(filepath, 'rb', buffering=0) as f:
+                hash_obj = _digest_file(
+                    f, self.algorithm, self.chunk_size, info.st_size
+                )
             
             return hash_obj.hexdigest()
             
@@ -174,7 +393,7 @@ class SHA256Hasher(HasherInterface):
     
     Features:
         - Cryptographically secure hashing
-        - Streaming file reading (64KB chunks) for large files
+        - Streaming file reading (1MB chunks, tunable) for large files
         - Graceful error handling for missing files
         - Collision resistance
     
@@ -196,10 +415,28 @@ class SHA256Hasher(HasherInterface):
         'a591a6d40bf420404a011733cfb7b190d62c65bf0bcda32b57b277d9ad9f146e'
     """
     
-    CHUNK_SIZE: int = 65536  # 64KB chunks for streaming
+    CHUNK_SIZE: int = 1 << 20  # 1MB chunks for streaming
     
-    def __init__(self) -> None:
-        """Initialize SHA-256 hasher."""
+    def __init__(self, chunk_size: int | None = None) -> None:
+        """
+        Initialize SHA-256 hasher.
+        
+        Args:
+            chunk_size: Bytes per read (or per mapped slice) when
+                streaming files; files up to this size are hashed from a
+                single read (default: CHUNK_SIZE)
+                
+        Raises:
+            ValidationError: If chunk_size is not a positive integer
+        """
+        if chunk_size is None:
+            chunk_size = self.CHUNK_SIZE
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValidationError(
+                "chunk_size must be a positive integer",
+                details={'chunk_size': chunk_size}
+            )
+        self.chunk_size = chunk_size
         self.algorithm = "sha256"
     
     @property
@@ -234,27 +471,27 @@ class SHA256Hasher(HasherInterface):
             )
         
         try:
-            hash_obj = hashlib.sha256()
-            hash_obj.update(data.encode('utf-8'))
-            return hash_obj.hexdigest()
-        except Exception as e:
+            encoded = data.encode('utf-8')
+        except UnicodeEncodeError as e:
             raise HashingError(
                 f"SHA-256 hashing failed: {str(e)}"
             ) from e
+        
+        return hashlib.sha256(encoded).hexdigest()
     
     def hash_file(self, filepath: str) -> str:
         """
         Generate SHA-256 hash of a file using streaming reads.
         
-        This method reads the file in 64KB chunks to prevent memory
+        This method reads the file in fixed-size chunks to prevent memory
         exhaustion on large files (10GB+). The entire file is never
         loaded into memory at once.
         
         Algorithm:
-            1. Initialize SHA-256 hash object
-            2. Open file in binary mode
-            3. Read and process 64KB chunks iteratively
-            4. Finalize and return hexadecimal digest
+            1. Open file in unbuffered binary mode
+            2. Stream it in chunk_size reads into one reusable buffer
+               (or chunk_size slices of a mapping for files of 16MB+)
+            3. Finalize and return hexadecimal digest
         
         Args:
             filepath: Path to file to hash
@@ -267,10 +504,10 @@ class SHA256Hasher(HasherInterface):
             HashingError: If hashing operation fails
             
         Time Complexity: O(n) where n is file size
-        Space Complexity: O(1) - only 64KB buffer in memory
+        Space Complexity: O(1) - at most one chunk buffer in memory
         
         Performance:
-            - Can hash 10GB file with only ~64KB RAM usage
+            - Can hash 10GB file with only ~1MB RAM usage
             - Typical speed: 200-500 MB/s depending on disk
         
         Example:
@@ -280,29 +517,155 @@ class SHA256Hasher(HasherInterface):
             >>> expected = "abc123..."
             >>> assert hash_value == expected
         """
-        path = Path(filepath)
+        info = _stat_file(filepath)
         
-        if not path.exists():
+        try:
+            with open(filepath, 'rb', buffering=0) as f:
+                hash_obj = _digest_file(
+                    f, self.algorithm, self.chunk_size, info.st_size
+                )
+            
+            return hash_obj.hexdigest()
+            
+        except PermissionError as e:
             raise FileOperationError(
-                f"File not found: {filepath}"
+                f"Permission denied reading file: {filepath}"
+            ) from e
+        except Exception as e:
+            raise HashingError(
+                f"SHA-256 file hashing failed: {str(e)}"
+            ) from e
+    
+    def __repr__(self) -> str:
+        """String representation of hasher."""
+        return f"SHA256Hasher(algorithm='{self.algorithm}')"
+
+
+class Blake3Hasher(HasherInterface):
+    """
+    BLAKE3 hash generator for strings and files (optional backend).
+    
+    BLAKE3 produces a 256-bit (64 hexadecimal character) hash value. It is
+    a tree hash with SIMD and multithreading built in, which makes it far
+    faster than SHA-256 on large files when integrity, not a specific
+    standardized algorithm, is what matters.
+    
+    Requires the ``blake3`` package; check ``HAS_BLAKE3`` before use.
+    
+    Features:
+        - Large files are memory-mapped and hashed across all cores
+        - Graceful error handling for missing files
+        - Supports both string and file hashing
+    
+    Time Complexity:
+        - String: O(n) where n is string length
+        - File: O(n / cores) where n is file size
+    
+    Example:
+        >>> hasher = Blake3Hasher()
+        >>> hash_value = hasher.hash_string("Hello World")
+        >>> len(hash_value)
+        64
+    """
+    
+    CHUNK_SIZE: int = 1 << 20  # Matches the hashlib hashers' streaming chunk
+    
+    def __init__(self, chunk_size: int | None = None) -> None:
+        """
+        Initialize BLAKE3 hasher.
+        
+        Args:
+            chunk_size: Files up to this size are hashed from a single read;
+                larger ones are memory-mapped (default: CHUNK_SIZE)
+                
+        Raises:
+            HashingError: If the blake3 package is not installed
+            ValidationError: If chunk_size is not a positive integer
+        """
+        if blake3 is None:
+            raise HashingError(
+                "BLAKE3 support requires the 'blake3' package",
+                details={'install': 'pip install crypto-sentinel[blake3]'}
             )
+        if chunk_size is None:
+            chunk_size = self.CHUNK_SIZE
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValidationError(
+                "chunk_size must be a positive integer",
+                details={'chunk_size': chunk_size}
+            )
+        self.chunk_size = chunk_size
+        self.algorithm = "blake3"
+    
+    @property
+    def algorithm_name(self) -> str:
+        """Return the algorithm name."""
+        return "BLAKE3"
+    
+    @property
+    def digest_size(self) -> int:
+        """Return digest size in bytes (BLAKE3 default = 256 bits = 32 bytes)."""
+        return 32
+    
+    def hash_string(self, data: str) -> str:
+        """
+        Generate BLAKE3 hash of a string.
         
-        if not path.is_file():
-            raise FileOperationError(
-                f"Path is not a file: {filepath}"
+        Args:
+            data: Input string to hash
+            
+        Returns:
+            Hexadecimal hash string (64 characters)
+            
+        Raises:
+            ValidationError: If data is not a string
+            HashingError: If hashing operation fails
+            
+        Time Complexity: O(n) where n is length of data
+        """
+        if not isinstance(data, str):
+            raise ValidationError(
+                f"Expected string, got {type(data).__name__}"
             )
         
         try:
-            hash_obj = hashlib.sha256()
+            return blake3.blake3(data.encode('utf-8')).hexdigest()
+        except Exception as e:
+            raise HashingError(
+                f"BLAKE3 hashing failed: {str(e)}"
+            ) from e
+    
+    def hash_file(self, filepath: str) -> str:
+        """
+        Generate BLAKE3 hash of a file.
+        
+        Files larger than ``chunk_size`` are memory-mapped by the blake3
+        extension and hashed on all available cores, so throughput scales
+        with the machine rather than a single-threaded read loop. Smaller
+        files are hashed from one read, skipping the mapping and thread
+        setup.
+        
+        Args:
+            filepath: Path to file to hash
             
-            with open(path, 'rb') as f:
-                while True:
-                    chunk = f.read(self.CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    hash_obj.update(chunk)
+        Returns:
+            Hexadecimal hash string (64 characters)
             
-            return hash_obj.hexdigest()
+        Raises:
+            FileOperationError: If file doesn't exist or can't be read
+            HashingError: If hashing operation fails
+            
+        Time Complexity: O(n) where n is file size
+        """
+        info = _stat_file(filepath)
+        
+        try:
+            if info.st_size <= self.chunk_size:
+                with open(filepath, 'rb', buffering=0) as f:
+                    return blake3.blake3(f.read()).hexdigest()
+            
+            hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            return hash_obj.update_mmap(filepath).hexdigest()
             
         except PermissionError as e:
             raise FileOperationError(
@@ -310,9 +673,9 @@ class SHA256Hasher(HasherInterface):
             ) from e
         except Exception as e:
             raise HashingError(
-                f"SHA-256 file hashing failed: {str(e)}"
+                f"BLAKE3 file hashing failed: {str(e)}"
             ) from e
     
     def __repr__(self) -> str:
         """String representation of hasher."""
-        return f"SHA256Hasher(algorithm='{self.algorithm}')"
+        return f"Blake3Hasher(algorithm='{self.algorithm}')"
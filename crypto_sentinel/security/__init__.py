@@ -3,13 +3,44 @@ Security tools module.
 
 Includes password strength analyzer and Base64 encoding utilities.
 
+Tool classes are imported lazily (PEP 562) so that using one tool does not
+pay the import cost of the other.
+
 Developer: saisrujanmurthy@gmail.com
 """
 
-from crypto_sentinel.security.password_analyzer import PasswordAnalyzer
-from crypto_sentinel.security.base64_tool import Base64Encoder
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .password_analyzer import PasswordAnalyzer
+    from .base64_tool import Base64Encoder
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "PasswordAnalyzer": "password_analyzer",
+    "Base64Encoder": "base64_tool",
+}
 
 __all__ = [
     'PasswordAnalyzer',
     'Base64Encoder',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a security tool class on first access and cache it in the module."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = importlib.import_module(f".{module_name}", __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
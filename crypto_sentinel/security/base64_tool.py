@@ -8,8 +8,14 @@ Developer: saisrujanmurthy@gmail.com
 """
 
 import base64
+import binascii
 from typing import Any
 
+try:
+    import pybase64
+except ImportError:  # Optional dependency: pip install crypto-sentinel[base64]
+    pybase64 = None
+
 from crypto_sentinel.core.base_cipher import CipherInterface
 from crypto_sentinel.core.exceptions import (
     EncryptionError,
@@ -18,6 +24,29 @@ from crypto_sentinel.core.exceptions import (
 )
 
 
+# SIMD-accelerated codec when pybase64 is installed; the stdlib otherwise.
+# Both decoders share the stdlib signature and semantics.
+if pybase64 is not None:
+    _b64encode = pybase64.b64encode
+    _b64encode_str = pybase64.b64encode_as_string
+    _b64decode = pybase64.b64decode
+else:
+    def _b64encode(data: bytes) -> bytes:
+        """Encode bytes to Base64 bytes without the b64encode wrapper."""
+        return binascii.b2a_base64(data, newline=False)
+    
+    def _b64encode_str(data: bytes) -> str:
+        """Encode bytes to a Base64 str without the b64encode wrapper."""
+        return binascii.b2a_base64(data, newline=False).decode('ascii')
+    
+    _b64decode = base64.b64decode
+
+# Every byte a padded standard Base64 string may contain
+_B64_ALPHABET = (
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/='
+)
+
+
 class Base64Encoder(CipherInterface):
     """
     Base64 encoder/decoder with robust error handling.
@@ -34,6 +63,7 @@ class Base64Encoder(CipherInterface):
         - Automatic padding correction
         - Graceful error handling
         - Both string and bytes input support
+        - SIMD-accelerated codec when the optional pybase64 is installed
     
     Padding:
         Base64 requires output length to be multiple of 4.
@@ -101,11 +131,8 @@ class Base64Encoder(CipherInterface):
             else:
                 data_bytes = data
             
-            # Encode to Base64
-            encoded_bytes = base64.b64encode(data_bytes)
-            
-            # Return as string
-            return encoded_bytes.decode('ascii')
+            # Encode to Base64 and return as string
+            return _b64encode_str(data_bytes)
             
         except Exception as e:
             raise EncryptionError(
@@ -154,17 +181,19 @@ class Base64Encoder(CipherInterface):
             )
         
         try:
-            # Convert to string if bytes
-            if isinstance(data, bytes):
+            # b64decode takes ASCII bytes as-is; only bytes that need
+            # padding (or are not ASCII) go through a str
+            if isinstance(data, bytes) and (not data.isascii() or len(data) % 4):
                 data_str = data.decode('ascii')
             else:
                 data_str = data
             
             # Auto-correct padding
-            data_str = self._fix_padding(data_str)
+            if len(data_str) % 4:
+                data_str = self._fix_padding(data_str)
             
             # Decode from Base64
-            decoded_bytes = base64.b64decode(data_str)
+            decoded_bytes = _b64decode(data_str)
             
             # Return as string
             return decoded_bytes.decode('utf-8')
@@ -278,6 +307,39 @@ class Base64Encoder(CipherInterface):
         """
         return self.encrypt(data, key=None)
     
+    def encrypt_bytes_to_bytes(self, data: bytes) -> bytes:
+        """
+        Encode bytes to Base64 bytes, skipping the str conversion.
+        
+        Useful when the result is written straight to a binary stream.
+        
+        Args:
+            data: Bytes to encode
+            
+        Returns:
+            Base64-encoded bytes
+            
+        Raises:
+            ValidationError: If data is not bytes
+            EncryptionError: If encoding fails
+            
+        Example:
+            >>> encoder = Base64Encoder()
+            >>> encoder.encrypt_bytes_to_bytes(b"Hello")
+            b'SGVsbG8='
+        """
+        if not isinstance(data, bytes):
+            raise ValidationError(
+                f"Expected bytes, got {type(data).__name__}"
+            )
+        
+        try:
+            return _b64encode(data)
+        except Exception as e:
+            raise EncryptionError(
+                f"Base64 encoding failed: {str(e)}"
+            ) from e
+    
     def decode_bytes(self, data: str) -> bytes:
         """
         Decode Base64 to bytes (not string).
@@ -299,8 +361,9 @@ class Base64Encoder(CipherInterface):
             b'\\x00\\xff\\x42'
         """
         try:
-            data_str = self._fix_padding(data)
-            return base64.b64decode(data_str)
+            if len(data) % 4:
+                data = self._fix_padding(data)
+            return _b64decode(data)
         except Exception as e:
             raise DecryptionError(
                 f"Base64 decoding to bytes failed: {str(e)}"
@@ -323,10 +386,18 @@ class Base64Encoder(CipherInterface):
             >>> encoder.is_valid_base64("not base64!")
             False
         """
+        # Reject strings with out-of-alphabet characters before decoding;
+        # deleting the alphabet leaves nothing behind for candidate input
+        if isinstance(data, str) and (
+            not data.isascii()
+            or data.encode('ascii').translate(None, _B64_ALPHABET)
+        ):
+            return False
+        
         try:
             # Fix padding and try to decode
             data_str = self._fix_padding(data)
-            base64.b64decode(data_str, validate=True)
+            _b64decode(data_str, validate=True)
             return True
         except Exception:
             return False
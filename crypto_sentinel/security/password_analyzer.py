@@ -9,12 +9,52 @@ Developer: saisrujanmurthy@gmail.com
 
 import math
 import re
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable
 from typing import Any
 
 from crypto_sentinel.core.base_analyzer import AnalyzerInterface
 from crypto_sentinel.core.exceptions import ValidationError
 
 
+# Character-class bits: lowercase, uppercase, digit, special
+_LOWER, _UPPER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+
+# Byte -> class bit. Non-ASCII bytes (and the '?' that latin-1 'replace'
+# substitutes for wider code points) all count as special characters.
+_CLASS_LUT = bytes(
+    _LOWER if 0x61 <= c <= 0x7a else
+    _UPPER if 0x41 <= c <= 0x5a else
+    _DIGIT if 0x30 <= c <= 0x39 else
+    _SPECIAL
+    for c in range(256)
+)
+
+# Longest password whose class bits are OR-reduced from a set; longer ones
+# use one C-level substring test per class
+_SET_SCAN_LIMIT = 96
+
+# Class mask -> character pool size (26 + 26 + 10 + 32 by bit)
+_POOL_SIZES = tuple(
+    (26 if m & _LOWER else 0)
+    + (26 if m & _UPPER else 0)
+    + (10 if m & _DIGIT else 0)
+    + (32 if m & _SPECIAL else 0)
+    for m in range(16)
+)
+
+# Pool size -> log2(pool size) for every non-empty class combination
+_LOG2_POOL = {size: math.log2(size) for size in _POOL_SIZES if size}
+
+# From this length on even the smallest pool (digits only) reaches the
+# 36-bit validate() threshold, so no character scan is needed
+_VALIDATE_SURE_LENGTH = math.ceil(36.0 / _LOG2_POOL[min(_LOG2_POOL)])
+
+# 2 ** x overflows a float once x reaches this many bits
+_MAX_FLOAT_EXP = sys.float_info.max_exp
+
+
 class PasswordAnalyzer(AnalyzerInterface):
     """
     Advanced password strength analyzer using entropy theory.
@@ -73,6 +113,30 @@ class PasswordAnalyzer(AnalyzerInterface):
         'strong': 128,
     }
     
+    # Strength levels, indexed by bisect_right(_LEVEL_THRESHOLDS, entropy)
+    _LEVEL_THRESHOLDS = tuple(ENTROPY_THRESHOLDS.values())
+    _LEVEL_NAMES = ('very_weak', 'weak', 'moderate', 'strong', 'very_strong')
+    
+    # Score band per level below 'very_strong': (base score, band start,
+    # band width, score span); score = base + int((E - start) / width * span)
+    _SCORE_BANDS = (
+        (0, 0, 28, 20),
+        (20, 28, 8, 20),
+        (40, 36, 24, 30),
+        (70, 60, 68, 20),
+    )
+    
+    # Pattern regexes, compiled once per process
+    _RE_REPEAT = re.compile(r'(.)\1{2,}')
+    _RE_SEQ_NUM = re.compile(r'(012|123|234|345|456|567|678|789|890)')
+    _RE_SEQ_ALPHA = re.compile(
+        r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)'
+    )
+    
+    # Common weak words and patterns (matched against the lowercased password)
+    _COMMON_WEAK = ('password', '123456', 'qwerty', 'admin', 'letmein', 'welcome')
+    _RE_COMMON_WEAK = re.compile('|'.join(map(re.escape, _COMMON_WEAK)))
+    
     def __init__(self) -> None:
         """Initialize password analyzer."""
         pass
@@ -87,12 +151,91 @@ class PasswordAnalyzer(AnalyzerInterface):
         """Return the analyzer version."""
         return "1.0.0"
     
-    def _calculate_pool_size(self, password: str) -> int:
+    @staticmethod
+    def _class_mask(password: str) -> int:
+        """
+        Classify every character of the password in a single pass.
+        
+        The password is mapped byte-for-byte through ``_CLASS_LUT`` with
+        ``bytes.translate`` and the distinct class bits are OR-reduced,
+        replacing four separate regex scans. Past ``_SET_SCAN_LIMIT``
+        characters, four ``in`` tests on the translated bytes are cheaper
+        than building a set from them.
+        
+        Args:
+            password: Password to analyze
+            
+        Returns:
+            Bitmask of ``_LOWER``, ``_UPPER``, ``_DIGIT`` and ``_SPECIAL``
+        """
+        classes = password.encode('latin-1', 'replace').translate(_CLASS_LUT)
+        
+        if len(classes) > _SET_SCAN_LIMIT:
+            return (
+                (_LOWER if b'\x01' in classes else 0)
+                | (_UPPER if b'\x02' in classes else 0)
+                | (_DIGIT if b'\x04' in classes else 0)
+                | (_SPECIAL if b'\x08' in classes else 0)
+            )
+        
+        mask = 0
+        for bit in set(classes):
+            mask |= bit
+        return mask
+    
+    def _scan(self, password: str) -> dict[str, Any]:
+        """
+        Collect every password feature the analysis needs in one sweep.
+        
+        The character-class mask, pattern flags and lowercased copy are
+        computed once here so that entropy, pool size and recommendations
+        do not each rescan the password.
+        
+        Args:
+            password: Password to analyze
+            
+        Returns:
+            Dictionary containing:
+                - length (int): Password length
+                - class_mask (int): Character-class bitmask
+                - has_repeat (bool): Three or more repeated characters
+                - has_seq_num (bool): Sequential digits present
+                - has_seq_alpha (bool): Sequential letters present
+                - has_common (bool): Contains a common weak word
+        """
+        lowered = password.lower()
+        class_mask = self._class_mask(password)
+        
+        # Sequence searches only run when the class mask says they can match
+        has_seq_num = (
+            bool(class_mask & _DIGIT)
+            and self._RE_SEQ_NUM.search(password) is not None
+        )
+        has_seq_alpha = (
+            bool(class_mask & (_LOWER | _UPPER))
+            and self._RE_SEQ_ALPHA.search(lowered) is not None
+        )
+        
+        return {
+            'length': len(password),
+            'class_mask': class_mask,
+            'has_repeat': self._RE_REPEAT.search(password) is not None,
+            'has_seq_num': has_seq_num,
+            'has_seq_alpha': has_seq_alpha,
+            'has_common': self._RE_COMMON_WEAK.search(lowered) is not None,
+        }
+    
+    def _calculate_pool_size(
+        self,
+        password: str,
+        scan: dict[str, Any] | None = None
+    ) -> int:
         """
         Calculate character pool size based on password composition.
         
         Args:
             password: Password to analyze
+            scan: Precomputed result of ``_scan`` (optional)
             
         Returns:
             Size of character pool (alphabet size)
@@ -103,24 +246,15 @@ class PasswordAnalyzer(AnalyzerInterface):
             - Check for digits: add 10
             - Check for special characters: add 32
         """
-        pool_size = 0
-        
-        if re.search(r'[a-z]', password):
-            pool_size += 26  # Lowercase letters
-        
-        if re.search(r'[A-Z]', password):
-            pool_size += 26  # Uppercase letters
-        
-        if re.search(r'[0-9]', password):
-            pool_size += 10  # Digits
-        
-        # Special characters (common printable ASCII excluding alphanumeric)
-        if re.search(r'[^a-zA-Z0-9]', password):
-            pool_size += 32  # Special characters (approximate)
-        
-        return pool_size
+        if scan is not None:
+            return _POOL_SIZES[scan['class_mask']]
+        return _POOL_SIZES[self._class_mask(password)]
     
-    def _calculate_entropy(self, password: str) -> float:
+    def _calculate_entropy(
+        self,
+        password: str,
+        scan: dict[str, Any] | None = None
+    ) -> float:
         """
         Calculate Shannon entropy in bits.
         
@@ -128,6 +262,7 @@ class PasswordAnalyzer(AnalyzerInterface):
         
         Args:
             password: Password to analyze
+            scan: Precomputed result of ``_scan`` (optional)
             
         Returns:
             Entropy in bits
@@ -139,12 +274,12 @@ class PasswordAnalyzer(AnalyzerInterface):
             E = 8 × log₂(26) = 8 × 4.7 = 37.6 bits
         """
         length = len(password)
-        pool_size = self._calculate_pool_size(password)
+        pool_size = self._calculate_pool_size(password, scan)
         
         if pool_size == 0:
             return 0.0
         
-        entropy = length * math.log2(pool_size)
+        entropy = length * _LOG2_POOL[pool_size]
         return entropy
     
     def _estimate_crack_time(self, entropy_bits: float) -> dict[str, Any]:
@@ -155,6 +290,9 @@ class PasswordAnalyzer(AnalyzerInterface):
             Search space: 2^E possibilities
             Time (seconds) = 2^E / (10^10 guesses/sec)
         
+        Above 1024 bits 2^E no longer fits in a float, so the time is
+        reported as infinity instead of raising OverflowError.
+        
         Args:
             entropy_bits: Password entropy in bits
             
@@ -168,8 +306,11 @@ class PasswordAnalyzer(AnalyzerInterface):
             Space = 2^40 = 1,099,511,627,776
             Time = 1.1 trillion / 10 billion = 110 seconds
         """
-        search_space = 2 ** entropy_bits
-        seconds = search_space / self.GUESSES_PER_SECOND
+        if entropy_bits < _MAX_FLOAT_EXP:
+            search_space = 2 ** entropy_bits
+            seconds = search_space / self.GUESSES_PER_SECOND
+        else:
+            seconds = math.inf
         
         # Convert to human-readable format
         if seconds < 1:
@@ -216,42 +357,45 @@ class PasswordAnalyzer(AnalyzerInterface):
         Returns:
             Score from 0 to 100
         """
-        if entropy_bits < self.ENTROPY_THRESHOLDS['very_weak']:
-            # Very weak: 0-20
-            score = int((entropy_bits / self.ENTROPY_THRESHOLDS['very_weak']) * 20)
-        elif entropy_bits < self.ENTROPY_THRESHOLDS['weak']:
-            # Weak: 21-40
-            score = 20 + int(((entropy_bits - 28) / 8) * 20)
-        elif entropy_bits < self.ENTROPY_THRESHOLDS['moderate']:
-            # Moderate: 41-70
-            score = 40 + int(((entropy_bits - 36) / 24) * 30)
-        elif entropy_bits < self.ENTROPY_THRESHOLDS['strong']:
-            # Strong: 71-90
-            score = 70 + int(((entropy_bits - 60) / 68) * 20)
+        level = bisect_right(self._LEVEL_THRESHOLDS, entropy_bits)
+        
+        if level < len(self._SCORE_BANDS):
+            base, start, width, span = self._SCORE_BANDS[level]
+            score = base + int(((entropy_bits - start) / width) * span)
         else:
             # Very strong: 91-100
             score = 90 + min(10, int((entropy_bits - 128) / 20))
         
         return min(100, max(0, score))
     
-    def _generate_recommendations(self, password: str, entropy_bits: float) -> list[str]:
+    def _generate_recommendations(
+        self,
+        password: str,
+        entropy_bits: float,
+        scan: dict[str, Any] | None = None
+    ) -> list[str]:
         """
         Generate actionable security recommendations.
         
         Args:
             password: Password to analyze
             entropy_bits: Calculated entropy
+            scan: Precomputed result of ``_scan`` (optional)
             
         Returns:
             List of recommendation strings
         """
         recommendations = []
         
-        length = len(password)
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'[0-9]', password))
-        has_special = bool(re.search(r'[^a-zA-Z0-9]', password))
+        if scan is None:
+            scan = self._scan(password)
+        
+        length = scan['length']
+        class_mask = scan['class_mask']
+        has_lower = bool(class_mask & _LOWER)
+        has_upper = bool(class_mask & _UPPER)
+        has_digit = bool(class_mask & _DIGIT)
+        has_special = bool(class_mask & _SPECIAL)
         
         # Length recommendations
         if length < 8:
@@ -273,18 +417,17 @@ class PasswordAnalyzer(AnalyzerInterface):
             recommendations.append("Add special characters (!@#$%^&*)")
         
         # Pattern detection
-        if re.search(r'(.)\1{2,}', password):
+        if scan['has_repeat']:
             recommendations.append("Avoid repeated characters (e.g., 'aaa', '111')")
         
-        if re.search(r'(012|123|234|345|456|567|678|789|890)', password):
+        if scan['has_seq_num']:
             recommendations.append("Avoid sequential numbers")
         
-        if re.search(r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)', password.lower()):
+        if scan['has_seq_alpha']:
             recommendations.append("Avoid sequential letters")
         
         # Common patterns
-        common_weak = ['password', '123456', 'qwerty', 'admin', 'letmein', 'welcome']
-        if any(weak in password.lower() for weak in common_weak):
+        if scan['has_common']:
             recommendations.append("Avoid common words and patterns")
         
         # Entropy-based recommendations
@@ -357,36 +500,76 @@ class PasswordAnalyzer(AnalyzerInterface):
                 'strength_level': 'very_weak',
             }
         
-        # Calculate metrics
-        entropy_bits = self._calculate_entropy(data)
+        # Calculate metrics from a single scan of the password
+        scan = self._scan(data)
+        entropy_bits = self._calculate_entropy(data, scan)
         crack_time = self._estimate_crack_time(entropy_bits)
         score = self._calculate_score(entropy_bits)
-        pool_size = self._calculate_pool_size(data)
-        recommendations = self._generate_recommendations(data, entropy_bits)
+        pool_size = self._calculate_pool_size(data, scan)
+        recommendations = self._generate_recommendations(data, entropy_bits, scan)
         
         # Determine strength level
-        if entropy_bits < 28:
-            strength_level = 'very_weak'
-        elif entropy_bits < 36:
-            strength_level = 'weak'
-        elif entropy_bits < 60:
-            strength_level = 'moderate'
-        elif entropy_bits < 128:
-            strength_level = 'strong'
-        else:
-            strength_level = 'very_strong'
+        strength_level = self._LEVEL_NAMES[
+            bisect_right(self._LEVEL_THRESHOLDS, entropy_bits)
+        ]
         
         return {
             'score': score,
             'entropy_bits': round(entropy_bits, 2),
             'crack_time_seconds': crack_time['seconds'],
             'crack_time_display': crack_time['display'],
-            'length': len(data),
+            'length': scan['length'],
             'pool_size': pool_size,
             'recommendations': recommendations,
             'strength_level': strength_level,
         }
     
+    def analyze_batch(self, passwords: Iterable[str]) -> list[dict[str, Any]]:
+        """
+        Analyze many passwords, e.g. when auditing a password dump.
+        
+        Each distinct password is analyzed once; repeated entries get
+        their own copy of the earlier result, so callers may mutate any
+        result without affecting the others.
+        
+        Args:
+            passwords: Passwords to analyze
+            
+        Returns:
+            One ``analyze`` result per password, in input order
+            
+        Raises:
+            ValidationError: If any entry is not a string
+            
+        Time Complexity: O(n) in the total length of distinct passwords
+        
+        Example:
+            >>> analyzer = PasswordAnalyzer()
+            >>> results = analyzer.analyze_batch(["123456", "Tr0ub4dor&3"])
+            >>> [r['strength_level'] for r in results]
+            ['very_weak', 'strong']
+        """
+        analyzed: dict[str, dict[str, Any]] = {}
+        results = []
+        
+        for password in passwords:
+            if not isinstance(password, str):
+                raise ValidationError(
+                    f"Expected string, got {type(password).__name__}"
+                )
+            
+            result = analyzed.get(password)
+            if result is None:
+                result = analyzed[password] = self.analyze(password)
+                results.append(result)
+            else:
+                results.append({
+                    **result,
+                    'recommendations': list(result['recommendations']),
+                })
+        
+        return results
+    
     def validate(self, data: str) -> bool:
         """
         Quick validation: Check if password meets minimum security requirements.
@@ -411,6 +594,9 @@ class PasswordAnalyzer(AnalyzerInterface):
         if not isinstance(data, str) or len(data) < 8:
             return False
         
+        if len(data) >= _VALIDATE_SURE_LENGTH:
+            return True
+        
         entropy = self._calculate_entropy(data)
         return entropy >= 36.0  # Minimum moderate strength
     
@@ -9,9 +9,11 @@ Developer: saisrujanmurthy@gmail.com
 
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from rich.console import Console
+from rich.align import Align
+from rich.console import Console, Group, RenderableType
+from rich.control import Control
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
@@ -53,9 +55,55 @@ class CryptoConsole:
         - Magenta: Special features
     """
     
+    # Static menu definitions: id -> (title, columns, rows)
+    MENU_SPECS: dict[str, tuple[str, list[tuple[str, str, int]], list[tuple[str, ...]]]] = {
+        'main': (
+            "Main Menu",
+            [("Category", "cyan", 25), ("Description", "white", 50)],
+            [
+                ("1", "🔐 Classical Ciphers", "Caesar, Vigenère, XOR, Substitution, Morse"),
+                ("2", "🔑 Hashing Tools", "MD5, SHA-256, Checksum Validation"),
+                ("3", "🛡️  Security Tools", "Password Analysis, Base64 Encoding"),
+                ("4", "❌ Exit", "Close CryptoSentinel"),
+            ],
+        ),
+        'cipher': (
+            "Classical Ciphers",
+            [("Cipher", "cyan", 20), ("Type", "white", 20), ("Cracking Method", "green", 30)],
+            [
+                ("1", "Caesar Cipher", "Shift", "Chi-squared frequency analysis"),
+                ("2", "Vigenère Cipher", "Polyalphabetic", "IoC-based key detection"),
+                ("3", "XOR Cipher", "Binary", "Single-byte brute force"),
+                ("4", "Substitution", "Monoalphabetic", "Simulated annealing"),
+                ("5", "Morse Code", "Encoding", "Dictionary lookup"),
+                ("6", "← Back", "Return to Main", ""),
+            ],
+        ),
+        'hashing': (
+            "Hashing Tools",
+            [("Tool", "cyan", 25), ("Description", "white", 50)],
+            [
+                ("1", "MD5 Hash", "Fast checksum (not secure)"),
+                ("2", "SHA-256 Hash", "Secure cryptographic hash"),
+                ("3", "File Checksum", "Validate file integrity"),
+                ("4", "← Back", "Return to Main Menu"),
+            ],
+        ),
+        'security': (
+            "Security Tools",
+            [("Tool", "cyan", 25), ("Description", "white", 50)],
+            [
+                ("1", "Password Analyzer", "Entropy & strength analysis"),
+                ("2", "Base64 Encoder", "Encode/decode Base64"),
+                ("3", "← Back", "Return to Main Menu"),
+            ],
+        ),
+    }
+    
     def __init__(self) -> None:
         """Initialize console with rich styling."""
         self.console = Console()
+        self._rendered_cache: dict[str, RenderableType] = {}
         
         # Initialize cipher instances
         self.ciphers = {
@@ -77,8 +125,27 @@ class CryptoConsole:
         self.password_analyzer = PasswordAnalyzer()
         self.base64_encoder = Base64Encoder()
     
-    def display_banner(self) -> None:
-        """Display stunning ASCII art banner in a panel."""
+    def _cached_render(self, key: str, factory: Callable[[], RenderableType]) -> RenderableType:
+        """Return a pre-built renderable, building it on first use.
+        
+        Static screens (banner, menus) never change between loop iterations,
+        so they are composed once and emitted with a single console.print.
+        
+        Args:
+            key: Cache key identifying the screen
+            factory: Zero-argument callable that builds the renderable
+        
+        Returns:
+            The cached renderable for ``key``
+        """
+        renderable = self._rendered_cache.get(key)
+        if renderable is None:
+            renderable = factory()
+            self._rendered_cache[key] = renderable
+        return renderable
+    
+    def _build_banner(self) -> RenderableType:
+        """Compose the ASCII art banner and version line into one renderable."""
         banner_text = """
  ██████╗██████╗ ██╗   ██╗██████╗ ████████╗ ██████╗ 
 ██╔════╝██╔══██╗╚██╗ ██╔╝██╔══██╗╚══██╔══╝██╔═══██╗
@@ -107,12 +174,62 @@ class CryptoConsole:
             padding=(1, 2)
         )
         
-        self.console.print(banner_panel)
-        self.console.print(
-            "[dim]Version 1.0.0 | Developer: saisrujanmurthy@gmail.com[/dim]\n",
-            justify="center"
+        return Group(
+            banner_panel,
+            Align.center(
+                Text.from_markup("[dim]Version 1.0.0 | Developer: saisrujanmurthy@gmail.com[/dim]")
+            ),
+            Text(),
         )
     
+    def _build_menu(self, menu_id: str) -> RenderableType:
+        """Compose the compact header and option table for a menu.
+        
+        Args:
+            menu_id: Key into MENU_SPECS
+        
+        Returns:
+            Group of header rule and menu table
+        """
+        title, columns, rows = self.MENU_SPECS[menu_id]
+        
+        table = Table(
+            box=box.ROUNDED,
+            border_style="cyan",
+            show_header=True,
+            header_style="bold magenta"
+        )
+        
+        table.add_column("Option", style="yellow", justify="center", width=8)
+        for header, style, width in columns:
+            table.add_column(header, style=style, width=width)
+        
+        for row in rows:
+            table.add_row(*row)
+        
+        return Group(
+            Text(),
+            Rule(
+                f"[bold cyan]CryptoSentinel[/bold cyan] [dim]│[/dim] [yellow]{title}[/yellow]",
+                style="cyan"
+            ),
+            Text(),
+            table,
+        )
+    
+    def display_banner(self) -> None:
+        """Display stunning ASCII art banner in a panel."""
+        self.console.print(self._cached_render('banner', self._build_banner))
+    
+    def display_welcome(self) -> None:
+        """Clear the screen and display the banner in a single write."""
+        banner = self._cached_render('banner', self._build_banner)
+        
+        if self.console.is_terminal and not self.console.is_dumb_terminal:
+            self.console.print(Control.clear(), Control.home(), banner)
+        else:
+            self.console.print(banner)
+    
     def display_compact_header(self, title: str) -> None:
         """Display a clean, compact header instead of the full banner.
         
@@ -128,43 +245,13 @@ class CryptoConsole:
         )
         self.console.print()
     
+    def _display_menu(self, menu_id: str) -> None:
+        """Print a cached menu screen with one console.print call."""
+        self.console.print(self._cached_render(menu_id, lambda: self._build_menu(menu_id)))
+    
     def main_menu(self) -> str:
         """Display main menu and return user choice."""
-        self.display_compact_header("Main Menu")
-        
-        table = Table(
-            box=box.ROUNDED,
-            border_style="cyan",
-            show_header=True,
-            header_style="bold magenta"
-        )
-        
-        table.add_column("Option", style="yellow", justify="center", width=8)
-        table.add_column("Category", style="cyan", width=25)
-        table.add_column("Description", style="white", width=50)
-        
-        table.add_row(
-            "1",
-            "🔐 Classical Ciphers",
-            "Caesar, Vigenère, XOR, Substitution, Morse"
-        )
-        table.add_row(
-            "2",
-            "🔑 Hashing Tools",
-            "MD5, SHA-256, Checksum Validation"
-        )
-        table.add_row(
-            "3",
-            "🛡️  Security Tools",
-            "Password Analysis, Base64 Encoding"
-        )
-        table.add_row(
-            "4",
-            "❌ Exit",
-            "Close CryptoSentinel"
-        )
-        
-        self.console.print(table)
+        self._display_menu('main')
         
         choice = Prompt.ask(
             "\n[bold yellow]Select an option[/bold yellow]",
@@ -176,28 +263,7 @@ class CryptoConsole:
     
     def cipher_menu(self) -> str:
         """Display cipher selection menu."""
-        self.display_compact_header("Classical Ciphers")
-        
-        table = Table(
-            box=box.ROUNDED,
-            border_style="cyan",
-            show_header=True,
-            header_style="bold magenta"
-        )
-        
-        table.add_column("Option", style="yellow", justify="center", width=8)
-        table.add_column("Cipher", style="cyan", width=20)
-        table.add_column("Type", style="white", width=20)
-        table.add_column("Cracking Method", style="green", width=30)
-        
-        table.add_row("1", "Caesar Cipher", "Shift", "Chi-squared frequency analysis")
-        table.add_row("2", "Vigenère Cipher", "Polyalphabetic", "IoC-based key detection")
-        table.add_row("3", "XOR Cipher", "Binary", "Single-byte brute force")
-        table.add_row("4", "Substitution", "Monoalphabetic", "Hill climbing algorithm")
-        table.add_row("5", "Morse Code", "Encoding", "Dictionary lookup")
-        table.add_row("6", "← Back", "Return to Main", "")
-        
-        self.console.print(table)
+        self._display_menu('cipher')
         
         choice = Prompt.ask(
             "\n[bold yellow]Select a cipher[/bold yellow]",
@@ -209,25 +275,7 @@ class CryptoConsole:
     
     def hashing_menu(self) -> str:
         """Display hashing tools menu."""
-        self.display_compact_header("Hashing Tools")
-        
-        table = Table(
-            box=box.ROUNDED,
-            border_style="cyan",
-            show_header=True,
-            header_style="bold magenta"
-        )
-        
-        table.add_column("Option", style="yellow", justify="center", width=8)
-        table.add_column("Tool", style="cyan", width=25)
-        table.add_column("Description", style="white", width=50)
-        
-        table.add_row("1", "MD5 Hash", "Fast checksum (not secure)")
-        table.add_row("2", "SHA-256 Hash", "Secure cryptographic hash")
-        table.add_row("3", "File Checksum", "Validate file integrity")
-        table.add_row("4", "← Back", "Return to Main Menu")
-        
-        self.console.print(table)
+        self._display_menu('hashing')
         
         choice = Prompt.ask(
             "\n[bold yellow]Select a tool[/bold yellow]",
@@ -239,24 +287,7 @@ class CryptoConsole:
     
     def security_menu(self) -> str:
         """Display security tools menu."""
-        self.display_compact_header("Security Tools")
-        
-        table = Table(
-            box=box.ROUNDED,
-            border_style="cyan",
-            show_header=True,
-            header_style="bold magenta"
-        )
-        
-        table.add_column("Option", style="yellow", justify="center", width=8)
-        table.add_column("Tool", style="cyan", width=25)
-        table.add_column("Description", style="white", width=50)
-        
-        table.add_row("1", "Password Analyzer", "Entropy & strength analysis")
-        table.add_row("2", "Base64 Encoder", "Encode/decode Base64")
-        table.add_row("3", "← Back", "Return to Main Menu")
-        
-        self.console.print(table)
+        self._display_menu('security')
         
         choice = Prompt.ask(
             "\n[bold yellow]Select a tool[/bold yellow]",
@@ -542,8 +573,9 @@ class CryptoConsole:
                 comparison_table.add_column("File", style="cyan", width=30)
                 comparison_table.add_column("Hash", style="yellow", width=64)
                 
-                comparison_table.add_row(Path(file1).name, result['hash1'])
-                comparison_table.add_row(Path(file2).name, result['hash2'])
+                not_hashed = "[dim]not hashed (file sizes differ)[/dim]"
+                comparison_table.add_row(Path(file1).name, result['hash1'] or not_hashed)
+                comparison_table.add_row(Path(file2).name, result['hash2'] or not_hashed)
                 
                 self.console.print("\n")
                 self.console.print(comparison_table)
@@ -750,5 +782,11 @@ class CryptoConsole:
         Prompt.ask("[dim]Press Enter to continue[/dim]", default="")
     
     def clear_screen(self) -> None:
-        """Clear the console screen."""
-        self.console.clear()
+        """Clear the console screen with a single ANSI escape write."""
+        if not self.console.is_terminal or self.console.is_dumb_terminal:
+            return
+        
+        # Erase display + cursor home, bypassing Rich's render pipeline
+        console_file = self.console.file
+        console_file.write("\x1b[2J\x1b[H")
+        console_file.flush()
@@ -54,6 +54,12 @@ setup(
             "sphinx>=7.1.0",
             "sphinx-rtd-theme>=1.3.0",
         ],
+        "blake3": [
+            "blake3>=0.4.0",
+        ],
+        "base64": [
+            "pybase64>=1.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -7,6 +7,10 @@ Substitution, and Morse code implementations.
 Developer: saisrujanmurthy@gmail.com
 """
 
+import io
+import random
+import tempfile
+from pathlib import Path
 import pytest
 from crypto_sentinel.ciphers import (
     CaesarCipher,
@@ -18,6 +22,7 @@ from crypto_sentinel.ciphers import (
 from crypto_sentinel.core.exceptions import (
     EncryptionError,
     DecryptionError,
+    FileOperationError,
     InvalidKeyError,
     ValidationError,
 )
@@ -117,6 +122,30 @@ class TestCaesarCipher:
         
         assert 'scores' in result
         assert len(result['scores']) == 26
+    
+    def test_crack_repeated_returns_independent_results(self) -> None:
+        """Test that memoized crack results cannot be mutated by callers."""
+        cipher = CaesarCipher()
+        encrypted = cipher.encrypt("THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG", key=7)
+        
+        first = cipher.crack(encrypted)
+        first['scores'].clear()
+        first['key'] = None
+        second = cipher.crack(encrypted)
+        
+        assert second['key'] == 7
+        assert len(second['scores']) == 26
+    
+    def test_crack_subclass_with_constructor_arguments(self) -> None:
+        """Test that cracking works for subclasses needing constructor args."""
+        class LabelledCaesar(CaesarCipher):
+            def __init__(self, label: str) -> None:
+                self.label = label
+        
+        cipher = LabelledCaesar("test")
+        encrypted = cipher.encrypt("THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG", key=5)
+        assert cipher.crack(encrypted)['key'] == 5
+        assert cipher.crack(encrypted * 200)['key'] == 5
 
 
 class TestVigenereCipher:
@@ -202,6 +231,14 @@ class TestXORCipher:
         assert isinstance(result, bytes)
         assert len(result) == 5
     
+    def test_encrypt_output_format(self) -> None:
+        """Test the output argument overrides the input-based format."""
+        cipher = XORCipher()
+        assert cipher.encrypt("HELLO", key=42, output='bytes') == cipher.encrypt(b"HELLO", key=42)
+        assert cipher.encrypt(b"HELLO", key=42, output='hex') == cipher.encrypt("HELLO", key=42)
+        with pytest.raises(ValidationError):
+            cipher.encrypt("HELLO", key=42, output='base64')
+    
     def test_decrypt_hex_string(self) -> None:
         """Test decrypting hex string."""
         cipher = XORCipher()
@@ -265,6 +302,88 @@ class TestXORCipher:
         
         assert 'scores' in result
         assert len(result['scores']) == 256
+    
+    def test_crack_bytes_like(self) -> None:
+        """Test cracking bytearray and memoryview ciphertext."""
+        cipher = XORCipher()
+        encrypted = cipher.encrypt(b"the quick brown fox jumps", key=42)
+        
+        for data in (bytearray(encrypted), memoryview(encrypted)):
+            result = cipher.crack(data)
+            assert result['key'] == 42
+            assert result['plaintext'] == "the quick brown fox jumps"
+    
+    def test_crack_batch(self) -> None:
+        """Test batch cracking returns one result per item, in order."""
+        cipher = XORCipher()
+        items = [
+            cipher.encrypt("meet me at the usual place", key=42),
+            cipher.encrypt(b"the quick brown fox jumps", key=7),
+        ]
+        results = cipher.crack_batch(items)
+        
+        assert [result['key'] for result in results] == [42, 7]
+        assert results[1]['plaintext'] == "the quick brown fox jumps"
+    
+    def test_encrypt_stream_matches_encrypt(self) -> None:
+        """Test chunked stream encryption keeps the key phase across chunks."""
+        cipher = XORCipher()
+        data = bytes(range(256)) * 5
+        src = io.BytesIO(data)
+        dst = io.BytesIO()
+        written = cipher.encrypt_stream(src, dst, key=b"KEY", chunk_size=100)
+        
+        assert written == len(data)
+        assert dst.getvalue() == cipher.encrypt(data, key=b"KEY")
+    
+    def test_encrypt_file_round_trip(self) -> None:
+        """Test file encryption matches encrypt() and reverses itself."""
+        cipher = XORCipher()
+        data = bytes(range(256)) * 40
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "plain.bin"
+            enc = Path(tmpdir) / "plain.xor"
+            dec = Path(tmpdir) / "plain.out"
+            src.write_bytes(data)
+            
+            assert cipher.encrypt_file(src, enc, key=b"KEY") == len(data)
+            assert enc.read_bytes() == cipher.encrypt(data, key=b"KEY")
+            cipher.encrypt_file(enc, dec, key=b"KEY")
+            assert dec.read_bytes() == data
+    
+    def test_encrypt_file_in_place_rejected(self) -> None:
+        """Test that encrypting a file onto itself fails without data loss."""
+        cipher = XORCipher()
+        data = b"do not truncate me"
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "plain.bin"
+            src.write_bytes(data)
+            
+            with pytest.raises(FileOperationError):
+                cipher.encrypt_file(src, src, key=42)
+            with pytest.raises(FileOperationError):
+                cipher.encrypt_file(src, Path(tmpdir) / "." / "plain.bin", key=42)
+            assert src.read_bytes() == data
+    
+    def test_encrypt_file_not_found(self) -> None:
+        """Test that non-existent file raises error."""
+        cipher = XORCipher()
+        with pytest.raises(FileOperationError):
+            cipher.encrypt_file("/nonexistent/file.bin", "/nonexistent/out.bin", key=42)
+    
+    def test_encrypt_stream_invalid_chunk_size(self) -> None:
+        """Test that a non-positive chunk size is rejected."""
+        cipher = XORCipher()
+        with pytest.raises(ValidationError):
+            cipher.encrypt_stream(io.BytesIO(b"HELLO"), io.BytesIO(), key=42, chunk_size=0)
+    
+    def test_encrypt_stream_text_source(self) -> None:
+        """Test that a text-mode source stream is rejected."""
+        cipher = XORCipher()
+        with pytest.raises(ValidationError):
+            cipher.encrypt_stream(io.StringIO("HELLO"), io.BytesIO(), key=42)
 
 
 class TestSubstitutionCipher:
@@ -337,6 +456,94 @@ class TestSubstitutionCipher:
         
         assert 'attempts' in result
         assert result['attempts'] > 100  # Should try many swaps
+    
+    def test_crack_parallel_workers(self) -> None:
+        """Test that parallel annealers return a valid permutation key."""
+        cipher = SubstitutionCipher()
+        plaintext = "the quick brown fox jumps over the lazy dog " * 5
+        key = "QWERTYUIOPASDFGHJKLZXCVBNM"
+        encrypted = cipher.encrypt(plaintext, key=key)
+        result = cipher.crack(encrypted, workers=2)
+        
+        assert sorted(result['key']) == list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        assert result['attempts'] == 2000
+        assert result['plaintext'] == cipher.decrypt(encrypted, result['key'])
+    
+    def test_crack_invalid_workers(self) -> None:
+        """Test that a non-positive worker count is rejected."""
+        cipher = SubstitutionCipher()
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG " * 20, workers=0)
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG " * 20, workers=True)
+    
+    def test_crack_rejects_bool_budgets(self) -> None:
+        """Test that bool iterations and restart_patience are rejected."""
+        cipher = SubstitutionCipher()
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG " * 20, iterations=True)
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG " * 20, restart_patience=False)
+    
+    def test_crack_validates_parameters_for_short_text(self) -> None:
+        """Test that invalid parameters are rejected before the length check."""
+        cipher = SubstitutionCipher()
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG", workers=0)
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG", iterations=-1)
+    
+    def test_crack_workers_capped_at_iterations(self) -> None:
+        """Test that extra workers never push attempts past the budget."""
+        cipher = SubstitutionCipher()
+        key = "QWERTYUIOPASDFGHJKLZXCVBNM"
+        ciphertext = cipher.encrypt("THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG " * 3, key)
+        result = cipher.crack(ciphertext, iterations=2, workers=4)
+        
+        assert result['attempts'] == 2
+        assert result['iterations'] == 2
+    
+    def test_crack_custom_budget(self) -> None:
+        """Test that the iteration budget and restart patience are honoured."""
+        cipher = SubstitutionCipher()
+        key = "QWERTYUIOPASDFGHJKLZXCVBNM"
+        ciphertext = cipher.encrypt("THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG " * 3, key)
+        result = cipher.crack(ciphertext, iterations=500, restart_patience=10)
+        assert result['attempts'] == 500
+        assert result['iterations'] == 500
+        assert sorted(result['key']) == list(cipher.ALPHABET)
+    
+    def test_crack_invalid_budget(self) -> None:
+        """Test that non-positive iterations or restart patience are rejected."""
+        cipher = SubstitutionCipher()
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG " * 20, iterations=0)
+        with pytest.raises(ValidationError):
+            cipher.crack("ITSSG " * 20, restart_patience=0)
+    
+    def test_crack_quality_not_below_baseline(self) -> None:
+        """Test that default cracking scores at least as well as the old annealer."""
+        cipher = SubstitutionCipher()
+        plaintext = (
+            "it was the best of times it was the worst of times it was the age "
+            "of wisdom it was the age of foolishness it was the epoch of belief "
+            "it was the epoch of incredulity it was the season of light it was "
+            "the season of darkness it was the spring of hope it was the winter "
+            "of despair"
+        )
+        encrypted = cipher.encrypt(plaintext, key="QWERTYUIOPASDFGHJKLZXCVBNM")
+        
+        # Mean trigram score of the fixed-temperature, reshuffling annealer
+        # over these seeds
+        baseline_mean = 6.97
+        
+        scores = []
+        for seed in range(30):
+            random.seed(seed)
+            result = cipher.crack(encrypted)
+            scores.append(cipher._score_trigrams(result['plaintext']))
+        
+        assert sum(scores) / len(scores) >= baseline_mean
 
 
 class TestMorseHandler:
@@ -7,12 +7,21 @@ including temporary file operations.
 Developer: saisrujanmurthy@gmail.com
 """
 
+import hashlib
+import io
 import tempfile
 import os
 from pathlib import Path
 import pytest
 
-from crypto_sentinel.hashing import MD5Hasher, SHA256Hasher, ChecksumValidator
+from crypto_sentinel.hashing import (
+    HAS_BLAKE3,
+    Blake3Hasher,
+    MD5Hasher,
+    SHA256Hasher,
+    ChecksumValidator,
+)
+from crypto_sentinel.hashing.hash_engine import _digest_mapped
 from crypto_sentinel.core.exceptions import (
     FileOperationError,
     HashingError,
@@ -203,6 +212,91 @@ class TestSHA256Hasher:
         finally:
             os.unlink(temp_path)
     
+    def test_hash_file_custom_chunk_size(self) -> None:
+        """Test that chunk size does not change the digest."""
+        small_chunks = SHA256Hasher(chunk_size=1000)
+        default = SHA256Hasher()
+        
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(bytes(range(256)) * 50)
+            temp_path = f.name
+        
+        try:
+            assert small_chunks.chunk_size == 1000
+            assert small_chunks.hash_file(temp_path) == default.hash_file(temp_path)
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_hash_file_reads_in_chunk_size_pieces(self, monkeypatch) -> None:
+        """Test that streamed files are hashed chunk_size bytes at a time."""
+        hasher = SHA256Hasher(chunk_size=1000)
+        update_sizes = []
+        real_new = hashlib.new
+        
+        class RecordingHash:
+            def __init__(self, *args, **kwargs) -> None:
+                self._hash = real_new(*args, **kwargs)
+            
+            def update(self, data) -> None:
+                update_sizes.append(len(data))
+                self._hash.update(data)
+            
+            def hexdigest(self) -> str:
+                return self._hash.hexdigest()
+        
+        monkeypatch.setattr(hashlib, 'new', RecordingHash)
+        
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(bytes(range(256)) * 50)
+            temp_path = f.name
+        
+        try:
+            digest = hasher.hash_file(temp_path)
+            assert update_sizes and max(update_sizes) <= 1000
+            assert sum(update_sizes) == 256 * 50
+            monkeypatch.undo()
+            assert digest == SHA256Hasher().hash_file(temp_path)
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_hash_file_mapped(self) -> None:
+        """Test that files hashed via memory mapping match the string hash."""
+        hasher = SHA256Hasher()
+        
+        # 16MB crosses the memory-mapping threshold
+        content = "C" * (16 * 1024 * 1024)
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+        
+        try:
+            assert hasher.hash_file(temp_path) == hasher.hash_string(content)
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_mapping_skipped_when_size_changed(self) -> None:
+        """Test that a file whose size no longer matches its stat is not mapped."""
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(b"G" * 100)
+            temp_path = f.name
+        
+        try:
+            with open(temp_path, 'rb') as f:
+                assert _digest_mapped(f, 'sha256', 1 << 20, 200) is None
+                assert _digest_mapped(f, 'sha256', 1 << 20, 100) is not None
+            
+        finally:
+            os.unlink(temp_path)
+    
+    def test_invalid_chunk_size(self) -> None:
+        """Test that non-positive chunk size raises error."""
+        with pytest.raises(ValidationError):
+            SHA256Hasher(chunk_size=0)
+    
     def test_repr(self) -> None:
         """Test string representation."""
         hasher = SHA256Hasher()
@@ -261,6 +355,120 @@ class TestChecksumValidator:
             os.unlink(path1)
             os.unlink(path2)
     
+    def test_compare_different_size_files(self) -> None:
+        """Test that files of different sizes mismatch without hashing."""
+        validator = ChecksumValidator()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f1:
+            f1.write("Short")
+            path1 = f1.name
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f2:
+            f2.write("Much longer content")
+            path2 = f2.name
+        
+        try:
+            result = validator.compare_files(path1, path2)
+            
+            assert result['match'] is False
+            assert result['hash1'] is None
+            assert result['hash2'] is None
+            
+        finally:
+            os.unlink(path1)
+            os.unlink(path2)
+    
+    def test_compare_fast(self) -> None:
+        """Test byte-level comparison without computing hashes."""
+        validator = ChecksumValidator()
+        
+        paths = []
+        for content in ("Same bytes", "Same bytes", "Diff bytes"):
+            with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+                f.write(content)
+                paths.append(f.name)
+        
+        try:
+            result = validator.compare_files(paths[0], paths[1], fast=True)
+            assert result['match'] is True
+            assert result['hash1'] is None
+            
+            result = validator.compare_files(paths[0], paths[2], fast=True)
+            assert result['match'] is False
+            
+            with pytest.raises(FileOperationError):
+                validator.compare_files(paths[0], "/nonexistent/file", fast=True)
+            
+        finally:
+            for path in paths:
+                os.unlink(path)
+    
+    def test_fast_compare_fills_short_reads(self) -> None:
+        """Test that short raw reads are retried until the buffer is full."""
+        class ShortReader:
+            def __init__(self, data: bytes) -> None:
+                self._stream = io.BytesIO(data)
+            
+            def readinto(self, buffer) -> int:
+                return self._stream.readinto(buffer[:3])
+        
+        buffer = bytearray(10)
+        reader = ShortReader(b"0123456789abc")
+        assert ChecksumValidator._read_full(reader, buffer) == 10
+        assert buffer == bytearray(b"0123456789")
+        assert ChecksumValidator._read_full(reader, buffer) == 3
+        assert buffer[:3] == bytearray(b"abc")
+    
+    def test_compare_large_files(self) -> None:
+        """Test comparing files larger than one hasher chunk."""
+        validator = ChecksumValidator()
+        chunk_size = validator.hashers['sha256'].chunk_size
+        
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f1:
+            f1.write(b"D" * (chunk_size + 1))
+            path1 = f1.name
+        
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f2:
+            f2.write(b"D" * chunk_size + b"E")
+            path2 = f2.name
+        
+        try:
+            result = validator.compare_files(path1, path2)
+            
+            assert result['match'] is False
+            assert len(result['hash1']) == 64
+            assert result['hash1'] != result['hash2']
+            
+            result = validator.compare_files(path1, path1)
+            assert result['match'] is True
+            
+        finally:
+            os.unlink(path1)
+            os.unlink(path2)
+    
+    def test_compare_missing_file_fails_before_hashing(self) -> None:
+        """Test that a missing second file is reported without hashing the first."""
+        validator = ChecksumValidator()
+        hasher = validator.hashers['sha256']
+        hashed = []
+        hash_file = hasher.hash_file
+        hasher.hash_file = lambda path: hashed.append(path) or hash_file(path)
+        
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(b"F" * (hasher.chunk_size + 1))
+            filepath = f.name
+        
+        try:
+            with pytest.raises(FileOperationError):
+                validator.compare_files(filepath, "/nonexistent/file.bin")
+            with pytest.raises(FileOperationError):
+                validator.compare_files(filepath, os.path.dirname(filepath))
+            
+            assert hashed == []
+            
+        finally:
+            os.unlink(filepath)
+    
     def test_compare_with_md5(self) -> None:
         """Test comparing files with MD5 algorithm."""
         validator = ChecksumValidator()
@@ -402,6 +610,149 @@ class TestChecksumValidator:
         finally:
             os.unlink(path)
     
+    def test_generate_report_unsupported_algorithm(self) -> None:
+        """Test that report rejects unsupported algorithms before hashing."""
+        validator = ChecksumValidator()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write("Report test")
+            path = f.name
+        
+        try:
+            with pytest.raises(ValidationError):
+                validator.generate_report(path, algorithms=['MD5', 'sha512'])
+        finally:
+            os.unlink(path)
+    
+    def test_generate_report_error_order(self) -> None:
+        """Test that algorithms are validated before the path is checked."""
+        validator = ChecksumValidator()
+        
+        with pytest.raises(ValidationError):
+            validator.generate_report("/nonexistent/file", algorithms=['sha512'])
+        with pytest.raises(ValidationError):
+            validator.generate_report("", algorithms=['sha512'])
+        with pytest.raises(FileOperationError, match="Path is not a file"):
+            validator.generate_report("")
+        with pytest.raises(FileOperationError, match="File not found"):
+            validator.generate_report("/nonexistent/file")
+    
+    def test_generate_report_matches_hashers(self) -> None:
+        """Test that single-pass report hashes match per-hasher results."""
+        validator = ChecksumValidator()
+        
+        # Larger than one chunk so the report reads several chunks
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(bytes(range(256)) * 5000)
+            path = f.name
+        
+        try:
+            report = validator.generate_report(path, algorithms=['SHA256', 'md5'])
+            
+            assert report['size'] == 256 * 5000
+            assert report['hashes'] == {
+                'sha256': SHA256Hasher().hash_file(path),
+                'md5': MD5Hasher().hash_file(path),
+            }
+            
+        finally:
+            os.unlink(path)
+    
+    def test_cache_invalidated_on_change(self) -> None:
+        """Test that memoized digests are refreshed when a file changes."""
+        validator = ChecksumValidator()
+        hasher = SHA256Hasher()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write("Version one")
+            path = f.name
+        
+        try:
+            first = validator.validate_file(path, hasher.hash_string("Version one"))
+            again = validator.validate_file(path, hasher.hash_string("Version one"))
+            assert first['match'] is True
+            assert again['computed_hash'] == first['computed_hash']
+            
+            with open(path, 'w') as f:
+                f.write("Version two, longer")
+            
+            result = validator.validate_file(path, first['computed_hash'])
+            assert result['match'] is False
+            
+            report = validator.generate_report(path, algorithms=['sha256'])
+            assert report['hashes']['sha256'] == hasher.hash_string("Version two, longer")
+            
+        finally:
+            os.unlink(path)
+    
+    def test_validate_detects_same_size_edit_with_restored_mtime(self) -> None:
+        """Test that an edit hidden behind a restored mtime is still caught."""
+        validator = ChecksumValidator()
+        hasher = SHA256Hasher()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write("Original text")
+            path = f.name
+        
+        try:
+            expected = hasher.hash_string("Original text")
+            assert validator.validate_file(path, expected)['match'] is True
+            
+            info = os.stat(path)
+            with open(path, 'w') as f:
+                f.write("Tampered text")
+            os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns))
+            
+            assert os.stat(path).st_mtime_ns == info.st_mtime_ns
+            assert validator.validate_file(path, expected)['match'] is False
+            
+        finally:
+            os.unlink(path)
+    
+    def test_hash_many(self) -> None:
+        """Test batch hashing matches single-file hashing."""
+        validator = ChecksumValidator()
+        hasher = SHA256Hasher()
+        
+        paths = []
+        for index in range(5):
+            with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+                f.write(f"Batch file {index}")
+                paths.append(f.name)
+        
+        try:
+            for workers in (1, 4):
+                digests = validator.hash_many(paths, workers=workers)
+                
+                assert list(digests) == paths
+                for index, path in enumerate(paths):
+                    assert digests[path] == hasher.hash_string(f"Batch file {index}")
+                
+                validator.clear_cache()
+            
+            with pytest.raises(FileOperationError):
+                validator.hash_many(paths + ["/nonexistent/file.txt"])
+            
+            with pytest.raises(ValidationError):
+                validator.hash_many(paths, workers=0)
+            
+            with pytest.raises(ValidationError):
+                validator.hash_many(paths, workers=True)
+            
+        finally:
+            for path in paths:
+                os.unlink(path)
+    
+    def test_hashers_built_once(self) -> None:
+        """Test that hashers are looked up lazily and reused."""
+        validator = ChecksumValidator()
+        
+        assert 'md5' in validator.hashers
+        assert 'sha512' not in validator.hashers
+        assert list(validator.hashers)[:2] == ['md5', 'sha256']
+        assert validator.hashers['md5'] is validator.hashers['md5']
+        assert isinstance(validator.hashers['sha256'], SHA256Hasher)
+    
     def test_repr(self) -> None:
         """Test string representation."""
         validator = ChecksumValidator()
@@ -426,6 +777,32 @@ class TestHashingIntegration:
         assert len(md5_hash) == 32
         assert len(sha256_hash) == 64
     
+    def test_blake3_optional(self) -> None:
+        """Test BLAKE3 is registered only when its package is installed."""
+        validator = ChecksumValidator()
+        
+        if not HAS_BLAKE3:
+            assert 'blake3' not in validator.hashers
+            with pytest.raises(HashingError):
+                Blake3Hasher()
+            return
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write("BLAKE3 content")
+            path = f.name
+        
+        try:
+            hasher = Blake3Hasher()
+            expected = hasher.hash_string("BLAKE3 content")
+            assert len(expected) == 64
+            assert hasher.hash_file(path) == expected
+            
+            report = validator.generate_report(path)
+            assert report['hashes']['blake3'] == expected
+            
+        finally:
+            os.unlink(path)
+    
     def test_file_integrity_workflow(self) -> None:
         """Test complete file integrity verification workflow."""
         # Create original file
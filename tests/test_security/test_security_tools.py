@@ -97,6 +97,15 @@ class TestPasswordAnalyzer:
         # Entropy = 9 * log2(94) ≈ 9 * 6.55 ≈ 59
         assert 57 < result['entropy_bits'] < 62
     
+    def test_pool_size_long_password(self) -> None:
+        """Test pool size detection on passwords of a few hundred characters."""
+        analyzer = PasswordAnalyzer()
+        
+        assert analyzer.analyze("a" * 300)['pool_size'] == 26
+        assert analyzer.analyze("a" * 299 + "7")['pool_size'] == 36
+        assert analyzer.analyze("Abc123!@#" * 30)['pool_size'] == 94
+        assert analyzer.analyze("\u00e9" * 300)['pool_size'] == 32
+    
     def test_crack_time_estimation(self) -> None:
         """Test that crack time increases with entropy."""
         analyzer = PasswordAnalyzer()
@@ -109,6 +118,17 @@ class TestPasswordAnalyzer:
         assert 'crack_time_display' in weak
         assert 'crack_time_display' in strong
     
+    def test_crack_time_very_long_password(self) -> None:
+        """Test that huge entropy does not overflow the crack time."""
+        analyzer = PasswordAnalyzer()
+        
+        result = analyzer.analyze("Ab1!" * 200)
+        
+        assert result['entropy_bits'] > 1024
+        assert result['crack_time_seconds'] == float('inf')
+        assert result['crack_time_display'] == "millions of years"
+        assert result['strength_level'] == 'very_strong'
+    
     def test_recommendations_for_short_password(self) -> None:
         """Test recommendations for short password."""
         analyzer = PasswordAnalyzer()
@@ -180,6 +200,13 @@ class TestPasswordAnalyzer:
         analyzer = PasswordAnalyzer()
         assert analyzer.validate("Sh0rt!") is False
     
+    def test_validate_digits_length_boundary(self) -> None:
+        """Test the 36-bit boundary for digits-only passwords."""
+        analyzer = PasswordAnalyzer()
+        # 10 * log2(10) = 33.2 bits, 11 * log2(10) = 36.5 bits
+        assert analyzer.validate("1357924680") is False
+        assert analyzer.validate("13579246801") is True
+    
     def test_score_ranges(self) -> None:
         """Test that scores are in valid range 0-100."""
         analyzer = PasswordAnalyzer()
@@ -203,6 +230,25 @@ class TestPasswordAnalyzer:
         with pytest.raises(ValidationError):
             analyzer.analyze(12345)
     
+    def test_analyze_batch(self) -> None:
+        """Test batch analysis matches per-password analysis."""
+        analyzer = PasswordAnalyzer()
+        passwords = ["password123", "Tr0ub4dor&3", "", "password123"]
+        
+        results = analyzer.analyze_batch(passwords)
+        
+        assert results == [analyzer.analyze(p) for p in passwords]
+        
+        # Repeated passwords get independent result dicts
+        results[0]['recommendations'].append("mutated")
+        assert "mutated" not in results[3]['recommendations']
+    
+    def test_analyze_batch_invalid_entry(self) -> None:
+        """Test that a non-string entry in a batch raises error."""
+        analyzer = PasswordAnalyzer()
+        with pytest.raises(ValidationError):
+            analyzer.analyze_batch(["password123", 12345])
+    
     def test_repr(self) -> None:
         """Test string representation."""
         analyzer = PasswordAnalyzer()
@@ -312,6 +358,15 @@ class TestBase64Encoder:
         result = encoder.encode_bytes(b"\x00\xff\x42")
         assert result == "AP9C"
     
+    def test_encrypt_bytes_to_bytes(self) -> None:
+        """Test bytes-in/bytes-out encoding."""
+        encoder = Base64Encoder()
+        assert encoder.encrypt_bytes_to_bytes(b"Hello") == b"SGVsbG8="
+        assert encoder.decrypt(encoder.encrypt_bytes_to_bytes(b"Hello")) == "Hello"
+        
+        with pytest.raises(ValidationError):
+            encoder.encrypt_bytes_to_bytes("Hello")
+    
     def test_decode_bytes_method(self) -> None:
         """Test decode_bytes method."""
         encoder = Base64Encoder()
@@ -333,6 +388,14 @@ class TestBase64Encoder:
         encoder = Base64Encoder()
         assert encoder.is_valid_base64("SGVsbG8") is True
     
+    def test_is_valid_base64_rejects_non_alphabet(self) -> None:
+        """Test validation rejects whitespace and non-ASCII characters."""
+        encoder = Base64Encoder()
+        assert encoder.is_valid_base64("SGVs bG8=") is False
+        assert encoder.is_valid_base64("SGVsbG8\n") is False
+        assert encoder.is_valid_base64("SGVsbG\u00e9=") is False
+        assert encoder.is_valid_base64(b"SGVsbG8=") is True
+    
     def test_padding_fix_no_change(self) -> None:
         """Test padding fix when no fix needed."""
         encoder = Base64Encoder()